@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -52,6 +52,13 @@ class AccessoryTable(TypedDict):
 class Accessories:
     """Accessory XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/accessory_ids.csv",
+        "{iXAssets}/mp/accessorytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/accessories.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Accessory XAssets."""
 
@@ -60,15 +67,15 @@ class Accessories:
         accessories = Accessories.IDs(self, accessories)
         accessories = Accessories.Table(self, accessories)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/accessories.json", accessories)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/accessories.json", accessories)
 
         log.info(f"Compiled {len(accessories):,} Accessories")
 
     def IDs(self: Any, accessories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/accessory_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/accessory_ids.csv", AccessoryIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/accessory_ids.csv", AccessoryIDs
         )
 
         if ids is None:
@@ -99,25 +106,23 @@ class Accessories:
     def Table(self: Any, accessories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/accessorytable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/accessorytable.csv", AccessoryTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/accessorytable.csv", AccessoryTable
         )
 
         if table is None:
             return accessories
 
-        for accessory in accessories:
-            for entry in table:
-                if accessory.get("altId") != entry.get("ref"):
-                    continue
-
-                accessory["name"] = self.localize.get(entry.get("name"))
-                accessory["description"] = self.localize.get(entry.get("description"))
-                accessory["flavor"] = self.localize.get(entry.get("storeFlavor"))
-                accessory["image"] = entry.get("lootImage")
-                accessory["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                accessory["hidden"] = bool(entry.get("hideInUI"))
+        for accessory, entry in Utility.JoinTable(
+            self, accessories, "altId", table, "ref"
+        ):
+            accessory["name"] = self.localize.get(entry.get("name"))
+            accessory["description"] = self.localize.get(entry.get("description"))
+            accessory["flavor"] = self.localize.get(entry.get("storeFlavor"))
+            accessory["image"] = entry.get("lootImage")
+            accessory["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            accessory["hidden"] = bool(entry.get("hideInUI"))
 
         return accessories
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -57,6 +57,10 @@ class BattlePassIDs(TypedDict):
 class BattlePasses:
     """Battle Pass XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/battlepass_season*.csv"]
+    outputs: List[str] = ["{eXAssets}/battlePasses.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Battle Pass XAssets."""
 
@@ -64,7 +68,7 @@ class BattlePasses:
 
         battlePasses = BattlePasses.Table(self, battlePasses)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/battlePasses.json", battlePasses)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/battlePasses.json", battlePasses)
 
         log.info(f"Compiled {len(battlePasses):,} Battle Passes")
 
@@ -74,7 +78,9 @@ class BattlePasses:
         for path in Utility.GetMatchingFiles(
             self, f"{self.iXAssets}/loot/", "csv", "battlepass_season", None
         ):
-            table: List[Dict[str, Any]] = Utility.ReadCSV(self, path, BattlePassSeason)
+            table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+                path, BattlePassSeason
+            )
 
             if table is None:
                 continue
@@ -117,6 +123,10 @@ class BattlePasses:
 class BattlePassItems:
     """Battle Pass Item XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/battlepass_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/battlePassItems.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Battle Pass Item XAssets."""
 
@@ -124,15 +134,15 @@ class BattlePassItems:
 
         items = BattlePassItems.Table(self, items)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/battlePassItems.json", items)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/battlePassItems.json", items)
 
         log.info(f"Compiled {len(items):,} Battle Pass Items")
 
     def Table(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/battlepass_ids.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/battlepass_ids.csv", BattlePassIDs
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/battlepass_ids.csv", BattlePassIDs
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -83,6 +83,10 @@ class BundleIDs(TypedDict):
 class Bundles:
     """Bundle XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/bundle_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/bundles.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Bundle XAssets."""
 
@@ -90,15 +94,15 @@ class Bundles:
 
         bundles = Bundles.IDs(self, bundles)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/bundles.json", bundles)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/bundles.json", bundles)
 
         log.info(f"Compiled {len(bundles):,} Bundles")
 
     def IDs(self: Any, bundles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/bundle_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/bundle_ids.csv", BundleIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/bundle_ids.csv", BundleIDs
         )
 
         if ids is None:
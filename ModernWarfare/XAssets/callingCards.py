@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -38,6 +38,13 @@ class CallingCardsTable(TypedDict):
 class CallingCards:
     """Calling Card XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/playercards_ids.csv",
+        "{iXAssets}/mp/callingcards.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/callingCards.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Calling Card XAssets."""
 
@@ -46,15 +53,15 @@ class CallingCards:
         cards = CallingCards.IDs(self, cards)
         cards = CallingCards.Table(self, cards)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/callingCards.json", cards)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/callingCards.json", cards)
 
         log.info(f"Compiled {len(cards):,} Calling Cards")
 
     def IDs(self: Any, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/playercards_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/playercards_ids.csv", PlayercardsIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/playercards_ids.csv", PlayercardsIDs
         )
 
         if ids is None:
@@ -83,23 +90,19 @@ class CallingCards:
     def Table(self: Any, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/callingcards.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/callingcards.csv", CallingCardsTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/callingcards.csv", CallingCardsTable
         )
 
         if table is None:
             return cards
 
-        for card in cards:
-            for entry in table:
-                if card.get("altId") != entry.get("ref"):
-                    continue
-
-                card["name"] = self.localize.get(entry.get("name"))
-                card["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                card["hidden"] = bool(entry.get("hideInUI"))
-                card["image"] = entry.get("image")
+        for card, entry in Utility.JoinTable(self, cards, "altId", table, "ref"):
+            card["name"] = self.localize.get(entry.get("name"))
+            card["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            card["hidden"] = bool(entry.get("hideInUI"))
+            card["image"] = entry.get("image")
 
         return cards
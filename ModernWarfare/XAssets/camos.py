@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -37,6 +37,13 @@ class CamoTable(TypedDict):
 class Camos:
     """Camo XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/camo_ids.csv",
+        "{iXAssets}/mp/camotable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/camos.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources", "camoCategories"]
+
     def Compile(self: Any) -> None:
         """Compile the Camo XAssets."""
 
@@ -45,15 +52,15 @@ class Camos:
         camos = Camos.IDs(self, camos)
         camos = Camos.Table(self, camos)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/camos.json", camos)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/camos.json", camos)
 
         log.info(f"Compiled {len(camos):,} Camos")
 
     def IDs(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/camo_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/camo_ids.csv", CamoIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/camo_ids.csv", CamoIDs
         )
 
         if ids is None:
@@ -83,26 +90,20 @@ class Camos:
     def Table(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/camotable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/camotable.csv", CamoTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/camotable.csv", CamoTable
         )
 
         if table is None:
             return camos
 
-        for camo in camos:
-            for entry in table:
-                if camo.get("altId") != entry.get("ref"):
-                    continue
-
-                camo["name"] = self.localize.get(entry.get("name"))
-                camo["category"] = self.ModernWarfare.GetCamoCategory(
-                    entry.get("category")
-                )
-                camo["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                camo["hidden"] = bool(entry.get("hidden"))
-                camo["image"] = entry.get("image")
+        for camo, entry in Utility.JoinTable(self, camos, "altId", table, "ref"):
+            camo["name"] = self.localize.get(entry.get("name"))
+            camo["category"] = self.ModernWarfare.GetCamoCategory(entry.get("category"))
+            camo["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            camo["hidden"] = bool(entry.get("hidden"))
+            camo["image"] = entry.get("image")
 
         return camos
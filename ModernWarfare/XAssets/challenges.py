@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypedDict, Union
 
 from utility import Utility
 
@@ -144,6 +144,10 @@ class T9SeasonalProgressionBlueprintRewards(TypedDict):
 class OfficerChallenges:
     """Officer Challenge XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/elder_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/officerChallenges.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Officer Challenge XAssets."""
 
@@ -151,15 +155,17 @@ class OfficerChallenges:
 
         challenges = OfficerChallenges.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/officerChallenges.json", challenges)
+        Utility.ExportXAsset(
+            self, f"{self.eXAssets}/officerChallenges.json", challenges
+        )
 
         log.info(f"Compiled {len(challenges):,} Officer Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the elder_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/elder_challenges.csv", ElderChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/elder_challenges.csv", ElderChallenges
         )
 
         if table is None:
@@ -192,6 +198,10 @@ class OfficerChallenges:
 class WeaponUnlockChallenges:
     """Weapon Unlock Challenge XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/gun_unlock_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weaponUnlockChallenges.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Weapon Unlock Challenge XAssets."""
 
@@ -199,7 +209,7 @@ class WeaponUnlockChallenges:
 
         challenges = WeaponUnlockChallenges.Table(self, challenges)
 
-        Utility.WriteFile(
+        Utility.ExportXAsset(
             self, f"{self.eXAssets}/weaponUnlockChallenges.json", challenges
         )
 
@@ -208,8 +218,8 @@ class WeaponUnlockChallenges:
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the gun_unlock_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/gun_unlock_challenges.csv", GunUnlockChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/gun_unlock_challenges.csv", GunUnlockChallenges
         )
 
         if table is None:
@@ -245,6 +255,10 @@ class WeaponUnlockChallenges:
 class WeeklyChallengesBR:
     """Weekly Battle Royale Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/br_weekly_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weeklyChallengesBR.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Weekly Battle Royale Challenges XAssets."""
 
@@ -252,15 +266,17 @@ class WeeklyChallengesBR:
 
         challenges = WeeklyChallengesBR.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/weeklyChallengesBR.json", challenges)
+        Utility.ExportXAsset(
+            self, f"{self.eXAssets}/weeklyChallengesBR.json", challenges
+        )
 
         log.info(f"Compiled {len(challenges):,} Weekly Battle Royale Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the br_weekly_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/br_weekly_challenges.csv", BRWeeklyChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/br_weekly_challenges.csv", BRWeeklyChallenges
         )
 
         if table is None:
@@ -302,6 +318,10 @@ class WeeklyChallengesBR:
 class WeeklyChallengesMP:
     """Weekly Multiplayer Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/weekly_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weeklyChallengesMP.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Weekly Multiplayer Challenges XAssets."""
 
@@ -309,15 +329,17 @@ class WeeklyChallengesMP:
 
         challenges = WeeklyChallengesMP.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/weeklyChallengesMP.json", challenges)
+        Utility.ExportXAsset(
+            self, f"{self.eXAssets}/weeklyChallengesMP.json", challenges
+        )
 
         log.info(f"Compiled {len(challenges):,} Weekly Multiplayer Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the weekly_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/weekly_challenges.csv", WeeklyChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/weekly_challenges.csv", WeeklyChallenges
         )
 
         if table is None:
@@ -359,6 +381,10 @@ class WeeklyChallengesMP:
 class MasteryChallenges:
     """Mastery Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/sticker_book_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/masteryChallenges.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Mastery Challenges XAssets."""
 
@@ -366,15 +392,17 @@ class MasteryChallenges:
 
         challenges = MasteryChallenges.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/masteryChallenges.json", challenges)
+        Utility.ExportXAsset(
+            self, f"{self.eXAssets}/masteryChallenges.json", challenges
+        )
 
         log.info(f"Compiled {len(challenges):,} Mastery Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the sticker_book_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/sticker_book_challenges.csv", StickerBookChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/sticker_book_challenges.csv", StickerBookChallenges
         )
 
         if table is None:
@@ -414,6 +442,10 @@ class MasteryChallenges:
 class TurboChallenges:
     """Tomogunchi Turbo Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/petwatchturbotable.csv"]
+    outputs: List[str] = ["{eXAssets}/turboChallenges.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Tomogunchi Turbo Challenges XAssets."""
 
@@ -421,15 +453,15 @@ class TurboChallenges:
 
         challenges = TurboChallenges.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/turboChallenges.json", challenges)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/turboChallenges.json", challenges)
 
         log.info(f"Compiled {len(challenges):,} Tomogunchi Turbo Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/petwatchturbotable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/petwatchturbotable.csv", PetWatchTurboTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/petwatchturbotable.csv", PetWatchTurboTable
         )
 
         if table is None:
@@ -455,6 +487,10 @@ class TurboChallenges:
 class MiscellaneousChallenges:
     """Miscellaneous Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/misc_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/miscChallenges.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Miscellaneous Challenges XAssets."""
 
@@ -462,15 +498,15 @@ class MiscellaneousChallenges:
 
         challenges = MiscellaneousChallenges.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/miscChallenges.json", challenges)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/miscChallenges.json", challenges)
 
         log.info(f"Compiled {len(challenges):,} Miscellaneous Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the misc_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/misc_challenges.csv", MiscChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/misc_challenges.csv", MiscChallenges
         )
 
         if table is None:
@@ -510,6 +546,10 @@ class MiscellaneousChallenges:
 class SeasonalChallenges:
     """Seasonal Challenges XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/t9_seasonal_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/seasonalChallenges.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Seasonal Challenges XAssets."""
 
@@ -517,15 +557,17 @@ class SeasonalChallenges:
 
         challenges = SeasonalChallenges.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/seasonalChallenges.json", challenges)
+        Utility.ExportXAsset(
+            self, f"{self.eXAssets}/seasonalChallenges.json", challenges
+        )
 
         log.info(f"Compiled {len(challenges):,} Seasonal Challenges")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/t9_seasonal_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/t9_seasonal_challenges.csv", T9SeasonalChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/t9_seasonal_challenges.csv", T9SeasonalChallenges
         )
 
         if table is None:
@@ -590,6 +632,12 @@ class SeasonalChallenges:
 class ProgressionRewards:
     """Progression Rewards XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/mp/progression/t9_seasonal_progression_blueprint_rewards.csv"
+    ]
+    outputs: List[str] = ["{eXAssets}/progressionRewards.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Progression Rewards XAssets."""
 
@@ -597,15 +645,14 @@ class ProgressionRewards:
 
         rewards = ProgressionRewards.Table(self, rewards)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/progressionRewards.json", rewards)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/progressionRewards.json", rewards)
 
         log.info(f"Compiled {len(rewards):,} Progression Rewards")
 
     def Table(self: Any, rewards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/progression/t9_seasonal_progression_blueprint_rewards.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self,
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
             f"{self.iXAssets}/mp/progression/t9_seasonal_progression_blueprint_rewards.csv",
             T9SeasonalProgressionBlueprintRewards,
         )
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -37,6 +37,13 @@ class WeaponCharmTable(TypedDict):
 class Charms:
     """Charm XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/weapon_charm_ids.csv",
+        "{iXAssets}/mp/weaponcharmtable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/charms.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Charm XAssets."""
 
@@ -45,15 +52,15 @@ class Charms:
         charms = Charms.IDs(self, charms)
         charms = Charms.Table(self, charms)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/charms.json", charms)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/charms.json", charms)
 
         log.info(f"Compiled {len(charms):,} Charms")
 
     def IDs(self: Any, charms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/weapon_charm_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/weapon_charm_ids.csv", WeaponCharmIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/weapon_charm_ids.csv", WeaponCharmIDs
         )
 
         if ids is None:
@@ -84,24 +91,20 @@ class Charms:
     def Table(self: Any, charms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/weaponcharmtable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/weaponcharmtable.csv", WeaponCharmTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/weaponcharmtable.csv", WeaponCharmTable
         )
 
         if table is None:
             return charms
 
-        for charm in charms:
-            for entry in table:
-                if charm.get("altId") != entry.get("ref"):
-                    continue
-
-                charm["name"] = self.localize.get(entry.get("name"))
-                charm["flavor"] = self.localize.get(entry.get("storeFlavor"))
-                charm["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                charm["hidden"] = bool(entry.get("hideInUI"))
-                charm["image"] = entry.get("image")
+        for charm, entry in Utility.JoinTable(self, charms, "altId", table, "ref"):
+            charm["name"] = self.localize.get(entry.get("name"))
+            charm["flavor"] = self.localize.get(entry.get("storeFlavor"))
+            charm["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            charm["hidden"] = bool(entry.get("hideInUI"))
+            charm["image"] = entry.get("image")
 
         return charms
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -26,6 +26,10 @@ class ConsumableIDs(TypedDict):
 class Consumables:
     """Consumable XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/consumable_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/consumables.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Consumable XAssets."""
 
@@ -33,15 +37,15 @@ class Consumables:
 
         consumables = Consumables.IDs(self, consumables)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/consumables.json", consumables)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/consumables.json", consumables)
 
         log.info(f"Compiled {len(consumables):,} Consumables")
 
     def IDs(self: Any, consumables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/consumable_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/consumable_ids.csv", ConsumableIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/consumable_ids.csv", ConsumableIDs
         )
 
         if ids is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypedDict
 
 from utility import Utility
 
@@ -109,6 +109,10 @@ class DLCIDs(TypedDict):
 class DLC:
     """DLC XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/dlc_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/dlc.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the DLC XAssets."""
 
@@ -116,15 +120,15 @@ class DLC:
 
         dlc = DLC.IDs(self, dlc)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/dlc.json", dlc)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/dlc.json", dlc)
 
         log.info(f"Compiled {len(dlc):,} DLC")
 
     def IDs(self: Any, dlc: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/dlc_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/dlc_ids.csv", DLCIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/dlc_ids.csv", DLCIDs
         )
 
         if ids is None:
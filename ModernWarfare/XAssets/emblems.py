@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -39,6 +39,13 @@ class EmblemTable(TypedDict):
 class Emblems:
     """Emblem XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/emblems_ids.csv",
+        "{iXAssets}/mp/emblemtable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/emblems.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Emblem XAssets."""
 
@@ -47,15 +54,15 @@ class Emblems:
         emblems = Emblems.IDs(self, emblems)
         emblems = Emblems.Table(self, emblems)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/emblems.json", emblems)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/emblems.json", emblems)
 
         log.info(f"Compiled {len(emblems):,} Emblems")
 
     def IDs(self: Any, emblems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/emblems_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/emblems_ids.csv", EmblemsIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/emblems_ids.csv", EmblemsIDs
         )
 
         if ids is None:
@@ -85,23 +92,19 @@ class Emblems:
     def Table(self: Any, emblems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/emblemtable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/emblemtable.csv", EmblemTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/emblemtable.csv", EmblemTable
         )
 
         if table is None:
             return emblems
 
-        for emblem in emblems:
-            for entry in table:
-                if emblem.get("altId") != entry.get("ref"):
-                    continue
-
-                emblem["name"] = self.localize.get(entry.get("name"))
-                emblem["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                emblem["hidden"] = bool(entry.get("hideInUI"))
-                emblem["image"] = entry.get("image")
+        for emblem, entry in Utility.JoinTable(self, emblems, "altId", table, "ref"):
+            emblem["name"] = self.localize.get(entry.get("name"))
+            emblem["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            emblem["hidden"] = bool(entry.get("hideInUI"))
+            emblem["image"] = entry.get("image")
 
         return emblems
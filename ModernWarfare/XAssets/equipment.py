@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -47,6 +47,13 @@ class EquipmentTable(TypedDict):
 class Equipment:
     """Equipment XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/equipment_ids.csv",
+        "{iXAssets}/mp/equipment.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/equipment.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Equipment XAssets."""
 
@@ -55,15 +62,15 @@ class Equipment:
         equipment = Equipment.IDs(self, equipment)
         equipment = Equipment.Table(self, equipment)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/equipment.json", equipment)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/equipment.json", equipment)
 
         log.info(f"Compiled {len(equipment):,} Equipment")
 
     def IDs(self: Any, equipment: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/equipment_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/equipment_ids.csv", EquipmentIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/equipment_ids.csv", EquipmentIDs
         )
 
         if ids is None:
@@ -92,22 +99,18 @@ class Equipment:
     def Table(self: Any, equipment: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/equipment.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/equipment.csv", EquipmentTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/equipment.csv", EquipmentTable
         )
 
         if table is None:
             return equipment
 
-        for item in equipment:
-            for entry in table:
-                if item.get("altId") != entry.get("ref"):
-                    continue
-
-                item["name"] = self.localize.get(entry.get("nameRef"))
-                item["description"] = self.localize.get(entry.get("desc"))
-                item["image"] = entry.get("progressionImage")
-                item["icon"] = entry.get("image")
-                item["video"] = entry.get("tutorialVideo")
+        for item, entry in Utility.JoinTable(self, equipment, "altId", table, "ref"):
+            item["name"] = self.localize.get(entry.get("nameRef"))
+            item["description"] = self.localize.get(entry.get("desc"))
+            item["image"] = entry.get("progressionImage")
+            item["icon"] = entry.get("image")
+            item["video"] = entry.get("tutorialVideo")
 
         return equipment
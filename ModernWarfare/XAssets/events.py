@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict, Union
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict, Union
 
 from utility import Utility
 
@@ -42,6 +42,10 @@ class BRPlaylistEvents(TypedDict):
 class SeasonalEvents:
     """Seasonal Event XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/seasonal_event.csv"]
+    outputs: List[str] = ["{eXAssets}/seasonalEvents.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Seasonal Event XAssets."""
 
@@ -49,15 +53,15 @@ class SeasonalEvents:
 
         challenges = SeasonalEvents.Table(self, challenges)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/seasonalEvents.json", challenges)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/seasonalEvents.json", challenges)
 
         log.info(f"Compiled {len(challenges):,} Seasonal Events")
 
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/seasonal_event.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/seasonal_event.csv", SeasonalEvent
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/seasonal_event.csv", SeasonalEvent
         )
 
         if table is None:
@@ -100,6 +104,10 @@ class SeasonalEvents:
 class PlaylistEvents:
     """Playlist Event XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/br_playlist_events.csv"]
+    outputs: List[str] = ["{eXAssets}/playlistEvents.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Playlist Event XAssets."""
 
@@ -107,15 +115,15 @@ class PlaylistEvents:
 
         events = PlaylistEvents.Table(self, events)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/playlistEvents.json", events)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/playlistEvents.json", events)
 
         log.info(f"Compiled {len(events):,} Playlist Events")
 
     def Table(self: Any, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/br_playlist_events.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/br_playlist_events.csv", BRPlaylistEvents, 1
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/br_playlist_events.csv", BRPlaylistEvents, 1
         )
 
         if table is None:
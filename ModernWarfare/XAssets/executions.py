@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -47,6 +47,13 @@ class ExecutionTable(TypedDict):
 class Executions:
     """Execution XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/executions_ids.csv",
+        "{iXAssets}/mp_cp/executiontable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/executions.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources", "operatorIds"]
+
     def Compile(self: Any) -> None:
         """Compile the Execution XAssets."""
 
@@ -55,15 +62,15 @@ class Executions:
         executions = Executions.IDs(self, executions)
         executions = Executions.Table(self, executions)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/executions.json", executions)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/executions.json", executions)
 
         log.info(f"Compiled {len(executions):,} Executions")
 
     def IDs(self: Any, executions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/executions_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/executions_ids.csv", ExecutionsIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/executions_ids.csv", ExecutionsIDs
         )
 
         if ids is None:
@@ -94,24 +101,22 @@ class Executions:
     def Table(self: Any, executions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/executiontable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp_cp/executiontable.csv", ExecutionTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp_cp/executiontable.csv", ExecutionTable
         )
 
         if table is None:
             return executions
 
-        for execution in executions:
-            for entry in table:
-                if execution.get("altId") != entry.get("ref"):
-                    continue
-
-                execution["name"] = self.localize.get(entry.get("name"))
-                execution["operatorId"] = self.ModernWarfare.GetOperatorID(
-                    entry.get("operatorRef")
-                )
-                execution["operatorAltId"] = entry.get("operatorRef")
-                execution["pet"] = entry.get("pet")
-                execution["image"] = entry.get("lootImage")
+        for execution, entry in Utility.JoinTable(
+            self, executions, "altId", table, "ref"
+        ):
+            execution["name"] = self.localize.get(entry.get("name"))
+            execution["operatorId"] = self.ModernWarfare.GetOperatorID(
+                entry.get("operatorRef")
+            )
+            execution["operatorAltId"] = entry.get("operatorRef")
+            execution["pet"] = entry.get("pet")
+            execution["image"] = entry.get("lootImage")
 
         return executions
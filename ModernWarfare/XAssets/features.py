@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -25,6 +25,10 @@ class FeatureIDs(TypedDict):
 class Features:
     """Feature XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/feature_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/features.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Feature XAssets."""
 
@@ -32,15 +36,15 @@ class Features:
 
         features = Features.IDs(self, features)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/features.json", features)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/features.json", features)
 
         log.info(f"Compiled {len(features):,} Features")
 
     def IDs(self: Any, features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/feature_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/feature_ids.csv", FeatureIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/feature_ids.csv", FeatureIDs
         )
 
         if ids is None:
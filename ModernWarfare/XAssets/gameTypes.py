@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -45,6 +45,10 @@ class GameTypesTable(TypedDict):
 class GameTypes:
     """Game Type XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/gametypestable.csv"]
+    outputs: List[str] = ["{eXAssets}/gameTypes.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Game Type XAssets."""
 
@@ -52,15 +56,15 @@ class GameTypes:
 
         types = GameTypes.Table(self, types)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/gameTypes.json", types)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/gameTypes.json", types)
 
         log.info(f"Compiled {len(types):,} Game Types")
 
     def Table(self: Any, types: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/gametypestable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/gametypestable.csv", GameTypesTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/gametypestable.csv", GameTypesTable
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -40,6 +40,13 @@ class GestureTable(TypedDict):
 class Gestures:
     """Gesture XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/gestures_ids.csv",
+        "{iXAssets}/mp/gesturetable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/gestures.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Gesture XAssets."""
 
@@ -48,15 +55,15 @@ class Gestures:
         gestures = Gestures.IDs(self, gestures)
         gestures = Gestures.Table(self, gestures)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/gestures.json", gestures)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/gestures.json", gestures)
 
         log.info(f"Compiled {len(gestures):,} Gestures")
 
     def IDs(self: Any, gestures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/gestures_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/gestures_ids.csv", GesturesIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/gestures_ids.csv", GesturesIDs
         )
 
         if ids is None:
@@ -85,20 +92,16 @@ class Gestures:
     def Table(self: Any, gestures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/gesturetable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/gesturetable.csv", GestureTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/gesturetable.csv", GestureTable
         )
 
         if table is None:
             return gestures
 
-        for gesture in gestures:
-            for entry in table:
-                if gesture.get("altId") != entry.get("ref"):
-                    continue
-
-                gesture["name"] = self.localize.get(entry.get("name"))
-                gesture["hidden"] = bool(entry.get("hideInUI"))
-                gesture["image"] = entry.get("lootImage")
+        for gesture, entry in Utility.JoinTable(self, gestures, "altId", table, "ref"):
+            gesture["name"] = self.localize.get(entry.get("name"))
+            gesture["hidden"] = bool(entry.get("hideInUI"))
+            gesture["image"] = entry.get("lootImage")
 
         return gestures
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -23,6 +23,10 @@ class ItemSourceTable(TypedDict):
 class ItemSources:
     """Item Source XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/itemsourcetable.csv"]
+    outputs: List[str] = ["{eXAssets}/itemSources.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Item Source XAssets."""
 
@@ -30,15 +34,15 @@ class ItemSources:
 
         sources = ItemSources.Table(self, sources)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/itemSources.json", sources)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/itemSources.json", sources)
 
         log.info(f"Compiled {len(sources):,} Item Sources")
 
     def Table(self: Any, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/itemsourcetable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/itemsourcetable.csv", ItemSourceTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/itemsourcetable.csv", ItemSourceTable
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -53,6 +53,13 @@ class KillstreakTable(TypedDict):
 class Killstreaks:
     """Killstreak XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/killstreak_ids.csv",
+        "{iXAssets}/mp/killstreaktable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/killstreaks.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Killstreak XAssets."""
 
@@ -61,15 +68,15 @@ class Killstreaks:
         streaks = Killstreaks.IDs(self, streaks)
         streaks = Killstreaks.Table(self, streaks)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/killstreaks.json", streaks)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/killstreaks.json", streaks)
 
         log.info(f"Compiled {len(streaks):,} Killstreaks")
 
     def IDs(self: Any, streaks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/killstreak_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/killstreak_ids.csv", KillstreakIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/killstreak_ids.csv", KillstreakIDs
         )
 
         if ids is None:
@@ -99,32 +106,28 @@ class Killstreaks:
     def Table(self: Any, streaks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/killstreaktable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/killstreaktable.csv", KillstreakTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/killstreaktable.csv", KillstreakTable
         )
 
         if table is None:
             return streaks
 
-        for streak in streaks:
-            for entry in table:
-                if streak.get("altId") != entry.get("ref"):
-                    continue
-
-                streak["name"] = self.localize.get(entry.get("name"))
-                streak["description"] = self.localize.get(entry.get("desc"))
-                streak["category"] = (
-                    None if (c := entry.get("streakType")) is None else c.title()
-                )
-                streak["costKills"] = entry.get("kills")
-                streak["costScore"] = entry.get("scoreCost")
-                streak["hidden"] = not bool(entry.get("showInMenus"))
-                streak["image"] = (
-                    None
-                    if (img := entry.get("progressionImage")) == "placeholder_x"
-                    else img
-                )
-                streak["icon"] = entry.get("tabletImage")
-                streak["video"] = entry.get("tutorialVideo")
+        for streak, entry in Utility.JoinTable(self, streaks, "altId", table, "ref"):
+            streak["name"] = self.localize.get(entry.get("name"))
+            streak["description"] = self.localize.get(entry.get("desc"))
+            streak["category"] = (
+                None if (c := entry.get("streakType")) is None else c.title()
+            )
+            streak["costKills"] = entry.get("kills")
+            streak["costScore"] = entry.get("scoreCost")
+            streak["hidden"] = not bool(entry.get("showInMenus"))
+            streak["image"] = (
+                None
+                if (img := entry.get("progressionImage")) == "placeholder_x"
+                else img
+            )
+            streak["icon"] = entry.get("tabletImage")
+            streak["video"] = entry.get("tutorialVideo")
 
         return streaks
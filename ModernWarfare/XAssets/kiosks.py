@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -43,6 +43,10 @@ class BRKioskPurchasesTruckWar(TypedDict):
 class KioskBR:
     """Battle Royale Kiosk Purchases XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/brkioskpurchases.csv"]
+    outputs: List[str] = ["{eXAssets}/kioskBR.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Battle Royale Kiosk Purchases XAssets."""
 
@@ -50,17 +54,15 @@ class KioskBR:
 
         items = KioskBR.IDs(self, items)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/kioskBR.json", items)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/kioskBR.json", items)
 
         log.info(f"Compiled {len(items):,} Kiosk Items (BR)")
 
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/brkioskpurchases.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self,
-            f"{self.iXAssets}/mp/brkioskpurchases.csv",
-            BRKioskPurchasesTruckWar,
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/brkioskpurchases.csv", BRKioskPurchasesTruckWar
         )
 
         if ids is None:
@@ -85,6 +87,10 @@ class KioskBR:
 class KioskBRTruck:
     """Battle Royale Kiosk Purchases (Truck War) XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/brkioskpurchases_truckwar.csv"]
+    outputs: List[str] = ["{eXAssets}/kioskBRTruck.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Battle Royale Kiosk Purchases (Truck War) XAssets."""
 
@@ -92,15 +98,14 @@ class KioskBRTruck:
 
         items = KioskBRTruck.IDs(self, items)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/kioskBRTruck.json", items)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/kioskBRTruck.json", items)
 
         log.info(f"Compiled {len(items):,} Kiosk Items (BR Truck War)")
 
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/brkioskpurchases_truckwar.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self,
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
             f"{self.iXAssets}/mp/brkioskpurchases_truckwar.csv",
             BRKioskPurchasesTruckWar,
         )
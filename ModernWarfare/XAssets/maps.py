@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -61,6 +61,10 @@ class MapInfo(TypedDict):
 class Maps:
     """Map XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/mapinfo.csv"]
+    outputs: List[str] = ["{eXAssets}/maps.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Map XAssets."""
 
@@ -68,15 +72,15 @@ class Maps:
 
         maps = Maps.Table(self, maps)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/maps.json", maps)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/maps.json", maps)
 
         log.info(f"Compiled {len(maps):,} Maps")
 
     def Table(self: Any, maps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/mapinfo.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/mapinfo.csv", MapInfo
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/mapinfo.csv", MapInfo
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypedDict
 
 from utility import Utility
 
@@ -93,6 +93,13 @@ class BRMissionsTable(TypedDict):
 class Missions:
     """Mission XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/quest_challenges.csv",
+        "{iXAssets}/mp/intel_challenges.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/missions.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Mission XAssets."""
 
@@ -101,15 +108,15 @@ class Missions:
         missions = Missions.QuestTable(self, missions)
         missions = Missions.IntelTable(self, missions)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/missions.json", missions)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/missions.json", missions)
 
         log.info(f"Compiled {len(missions):,} Missions")
 
     def QuestTable(self: Any, missions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the quest_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/quest_challenges.csv", QuestChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/quest_challenges.csv", QuestChallenges
         )
 
         if table is None:
@@ -169,20 +176,23 @@ class Missions:
     def IntelTable(self: Any, missions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/intel_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/intel_challenges.csv", IntelChallenges
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/intel_challenges.csv", IntelChallenges
         )
 
         if table is None:
             return missions
 
-        for mission in missions:
-            for objective in mission.get("objectives", []):
-                for entry in table:
-                    if objective.get("altId") != entry.get("ref"):
-                        continue
+        objectives: List[Dict[str, Any]] = [
+            objective
+            for mission in missions
+            for objective in mission.get("objectives", [])
+        ]
 
-                    objective["image"] = entry.get("image")
+        for objective, entry in Utility.JoinTable(
+            self, objectives, "altId", table, "ref"
+        ):
+            objective["image"] = entry.get("image")
 
         return missions
 
@@ -190,6 +200,10 @@ class Missions:
 class MissionItems:
     """Mission Item XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/mission_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/missionItems.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Mission Item XAssets."""
 
@@ -197,15 +211,15 @@ class MissionItems:
 
         items = MissionItems.IDs(self, items)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/missionItems.json", items)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/missionItems.json", items)
 
         log.info(f"Compiled {len(items):,} Mission Items")
 
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/mission_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/mission_ids.csv", MissionIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/mission_ids.csv", MissionIDs
         )
 
         if ids is None:
@@ -240,6 +254,10 @@ class MissionItems:
 class BRMissions:
     """BR Missions XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/brmissions.csv"]
+    outputs: List[str] = ["{eXAssets}/brMissions.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the BR Missions XAssets."""
 
@@ -247,15 +265,15 @@ class BRMissions:
 
         missions = BRMissions.Table(self, missions)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/brMissions.json", missions)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/brMissions.json", missions)
 
         log.info(f"Compiled {len(missions):,} BR Missions")
 
     def Table(self: Any, missions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/brmissions.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/brmissions.csv", BRMissionsTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/brmissions.csv", BRMissionsTable
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -109,6 +109,14 @@ class IntelBillets(TypedDict):
 class Operators:
     """Operator XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/operators.csv",
+        "{iXAssets}/mp/factiontable.csv",
+        "{iXAssets}/cp/cp_intel_billets.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operators.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources", "operatorIds"]
+
     def Compile(self: Any) -> None:
         """Compile the Operator XAssets."""
 
@@ -119,14 +127,14 @@ class Operators:
         operators = Operators.FactionTable(self, operators)
         operators = Operators.IntelBillets(self, operators)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/operators.json", operators)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/operators.json", operators)
 
         log.info(f"Compiled {len(operators):,} Operators")
 
     def IDs(self: Any, operators: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operators_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = self.ModernWarfare.operatorIds
+        ids: List[Dict[str, Any]] = self.ModernWarfare.operatorIds.rows
 
         if ids is None:
             return operators
@@ -163,52 +171,50 @@ class Operators:
     def Table(self: Any, operators: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the operators.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/operators.csv", OperatorsTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/operators.csv", OperatorsTable
         )
 
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                if operator.get("altId") != entry.get("ref"):
-                    continue
-
-                operator["name"] = self.localize.get(entry.get("name")).title()
-                operator["description"] = self.localize.get(entry.get("background"))
-                operator["faction"] = entry.get("superFaction")
-                operator["branch"] = entry.get("factionRef")
-                operator["branchIcon"] = entry.get("factionIcon")
-                operator["thumbprint"] = entry.get("thumbprint")
-                operator["launchOperator"] = bool(entry.get("isLaunchOperator"))
-                operator["image"] = entry.get("icon")
-                operator["video"] = (
-                    None
-                    if ((v := entry.get("introVideo")) is None)
-                    or (v.endswith("_placeholder"))
-                    else v
-                )
-                operator["hidden"] = bool(entry.get("hiddenWhenLocked"))
-                operator["billets"] = [
-                    {
-                        "label": self.localize.get("LUA_MENU/CITIZENSHIP"),
-                        "value": self.localize.get(entry.get("citizenship")),
-                    },
-                    {
-                        "label": self.localize.get("LUA_MENU/FIRST_LANGUAGE"),
-                        "value": self.localize.get(entry.get("firstLanguage")),
-                    },
-                    {
-                        "label": self.localize.get("LUA_MENU/STATUS"),
-                        "value": self.localize.get(entry.get("status")),
-                    },
-                ]
+        for operator, entry in Utility.JoinTable(
+            self, operators, "altId", table, "ref"
+        ):
+            operator["name"] = self.localize.get(entry.get("name")).title()
+            operator["description"] = self.localize.get(entry.get("background"))
+            operator["faction"] = entry.get("superFaction")
+            operator["branch"] = entry.get("factionRef")
+            operator["branchIcon"] = entry.get("factionIcon")
+            operator["thumbprint"] = entry.get("thumbprint")
+            operator["launchOperator"] = bool(entry.get("isLaunchOperator"))
+            operator["image"] = entry.get("icon")
+            operator["video"] = (
+                None
+                if ((v := entry.get("introVideo")) is None)
+                or (v.endswith("_placeholder"))
+                else v
+            )
+            operator["hidden"] = bool(entry.get("hiddenWhenLocked"))
+            operator["billets"] = [
+                {
+                    "label": self.localize.get("LUA_MENU/CITIZENSHIP"),
+                    "value": self.localize.get(entry.get("citizenship")),
+                },
+                {
+                    "label": self.localize.get("LUA_MENU/FIRST_LANGUAGE"),
+                    "value": self.localize.get(entry.get("firstLanguage")),
+                },
+                {
+                    "label": self.localize.get("LUA_MENU/STATUS"),
+                    "value": self.localize.get(entry.get("status")),
+                },
+            ]
 
-                # Workaround to solve for placeholder Operator descriptions.
-                if entry.get("background") == "LUA_MENU/PRICE_BACKGROUND":
-                    if operator.get("altId") != "price_western":
-                        operator["description"] = None
+            # Workaround to solve for placeholder Operator descriptions.
+            if entry.get("background") == "LUA_MENU/PRICE_BACKGROUND":
+                if operator.get("altId") != "price_western":
+                    operator["description"] = None
 
         return operators
 
@@ -217,40 +223,38 @@ class Operators:
     ) -> List[Dict[str, Any]]:
         """Compile the mp/factiontable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/factiontable.csv", FactionTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/factiontable.csv", FactionTable
         )
 
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                if operator.get("branch") != entry.get("ref"):
-                    continue
-
-                operator["branch"] = self.localize.get(entry.get("name"))
-
-                if operator.get("altId").startswith("default_"):
-                    # This is a workaround as Infinity Ward does not distinguish
-                    # the two Mil-Sim branches in the factiontable, thus resulting
-                    # in each incorrectly belonging to Coalition.
-                    if (faction := operator.get("faction")) == 0:
-                        operator["faction"] = self.localize.get("LUA_MENU/THE_WEST")
-                    elif faction == 1:
-                        operator["faction"] = self.localize.get("LUA_MENU/THE_EAST")
-                    else:
-                        operator["faction"] = None
+        # The branch is replaced by its localized name upon a match, so only
+        # the first matching entry applies.
+        for operator, entry in Utility.JoinTable(
+            self, operators, "branch", table, "ref", first=True
+        ):
+            operator["branch"] = self.localize.get(entry.get("name"))
+
+            if operator.get("altId").startswith("default_"):
+                # This is a workaround as Infinity Ward does not distinguish
+                # the two Mil-Sim branches in the factiontable, thus resulting
+                # in each incorrectly belonging to Coalition.
+                if (faction := operator.get("faction")) == 0:
+                    operator["faction"] = self.localize.get("LUA_MENU/THE_WEST")
+                elif faction == 1:
+                    operator["faction"] = self.localize.get("LUA_MENU/THE_EAST")
                 else:
-                    operator["faction"] = self.localize.get(
-                        entry.get("superFactionName")
-                    )
+                    operator["faction"] = None
+            else:
+                operator["faction"] = self.localize.get(entry.get("superFactionName"))
 
-                # Workaround to solve for Black Ops Cold War Operators who do not
-                # utilize a Faction Branch.
-                if operator["faction"] == operator["branch"]:
-                    operator["branch"] = None
-                    operator["branchIcon"] = None
+            # Workaround to solve for Black Ops Cold War Operators who do not
+            # utilize a Faction Branch.
+            if operator["faction"] == operator["branch"]:
+                operator["branch"] = None
+                operator["branchIcon"] = None
 
         return operators
 
@@ -259,130 +263,112 @@ class Operators:
     ) -> List[Dict[str, Any]]:
         """Compile the cp/cp_intel_billets.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/cp/cp_intel_billets.csv", IntelBillets
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/cp/cp_intel_billets.csv", IntelBillets
         )
 
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                operatorRef: str = operator.get("altId").split("_")[0]
-                entryRef: str = entry.get("ref").split("_")[1]
-
-                if operatorRef != entryRef:
-                    continue
-
-                operator["billets"].extend(
-                    [
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_NAME_TITLE"),
-                            "value": self.localize.get(entry.get("name")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_CODENAME_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("codeName")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_ALIASES_TITLE"),
-                            "value": self.localize.get(entry.get("aliases")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_NATIONALITY_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("nationality")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_DOB_TITLE"),
-                            "value": self.localize.get(entry.get("dob")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_GENDER_TITLE"),
-                            "value": self.localize.get(entry.get("gender")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_LATERALITY_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("laterality")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HEIGHT_TITLE"),
-                            "value": self.localize.get(entry.get("height")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_WEIGHT_TITLE"),
-                            "value": self.localize.get(entry.get("weight")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_VISION_TITLE"),
-                            "value": self.localize.get(entry.get("vision")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_BLOOD_TITLE"),
-                            "value": self.localize.get(entry.get("blood")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_EYECOLOR_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("eyeColor")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HAIR_TITLE"),
-                            "value": self.localize.get(entry.get("hairColor")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_RELATIVES_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("relatives")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_LANGUAGES_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("languages")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_MARITALSTATUS_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("maritalStatus")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_CHILDERN_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("children")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_SPECIALIST_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("specialistFields")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HISTORY_TITLE"),
-                            "value": self.localize.get(entry.get("history")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_ASSOCIATIONS_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("associations")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_DIRECTIVE_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("directive")),
-                        },
-                    ]
-                )
+        for operator, entry in Utility.JoinTable(
+            self,
+            operators,
+            lambda k: k.get("altId").split("_")[0],
+            table,
+            lambda k: k.get("ref").split("_")[1],
+            many=True,
+        ):
+            operator["billets"].extend(
+                [
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_NAME_TITLE"),
+                        "value": self.localize.get(entry.get("name")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_CODENAME_TITLE"),
+                        "value": self.localize.get(entry.get("codeName")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_ALIASES_TITLE"),
+                        "value": self.localize.get(entry.get("aliases")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_NATIONALITY_TITLE"),
+                        "value": self.localize.get(entry.get("nationality")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_DOB_TITLE"),
+                        "value": self.localize.get(entry.get("dob")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_GENDER_TITLE"),
+                        "value": self.localize.get(entry.get("gender")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_LATERALITY_TITLE"),
+                        "value": self.localize.get(entry.get("laterality")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HEIGHT_TITLE"),
+                        "value": self.localize.get(entry.get("height")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_WEIGHT_TITLE"),
+                        "value": self.localize.get(entry.get("weight")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_VISION_TITLE"),
+                        "value": self.localize.get(entry.get("vision")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_BLOOD_TITLE"),
+                        "value": self.localize.get(entry.get("blood")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_EYECOLOR_TITLE"),
+                        "value": self.localize.get(entry.get("eyeColor")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HAIR_TITLE"),
+                        "value": self.localize.get(entry.get("hairColor")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_RELATIVES_TITLE"),
+                        "value": self.localize.get(entry.get("relatives")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_LANGUAGES_TITLE"),
+                        "value": self.localize.get(entry.get("languages")),
+                    },
+                    {
+                        "label": self.localize.get(
+                            "CP_INTEL/BILLET_MARITALSTATUS_TITLE"
+                        ),
+                        "value": self.localize.get(entry.get("maritalStatus")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_CHILDERN_TITLE"),
+                        "value": self.localize.get(entry.get("children")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_SPECIALIST_TITLE"),
+                        "value": self.localize.get(entry.get("specialistFields")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HISTORY_TITLE"),
+                        "value": self.localize.get(entry.get("history")),
+                    },
+                    {
+                        "label": self.localize.get(
+                            "CP_INTEL/BILLET_ASSOCIATIONS_TITLE"
+                        ),
+                        "value": self.localize.get(entry.get("associations")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_DIRECTIVE_TITLE"),
+                        "value": self.localize.get(entry.get("directive")),
+                    },
+                ]
+            )
 
         return operators
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -37,6 +37,13 @@ class OperatorQuips(TypedDict):
 class Quips:
     """Quip XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/operator_quip_ids.csv",
+        "{iXAssets}/operatorquips.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operatorQuips.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources", "operatorIds"]
+
     def Compile(self: Any) -> None:
         """Compile the Quip XAssets."""
 
@@ -45,15 +52,15 @@ class Quips:
         quips = Quips.IDs(self, quips)
         quips = Quips.Table(self, quips)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/operatorQuips.json", quips)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/operatorQuips.json", quips)
 
         log.info(f"Compiled {len(quips):,} Operator Quips")
 
     def IDs(self: Any, quips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operator_quip_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/operator_quip_ids.csv", OperatorQuipIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/operator_quip_ids.csv", OperatorQuipIDs
         )
 
         if ids is None:
@@ -84,24 +91,20 @@ class Quips:
     def Table(self: Any, quips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the operatorquips.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/operatorquips.csv", OperatorQuips
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/operatorquips.csv", OperatorQuips
         )
 
         if table is None:
             return quips
 
-        for quip in quips:
-            for entry in table:
-                if quip.get("altId") != entry.get("ref"):
-                    continue
-
-                quip["name"] = self.localize.get(entry.get("name"))
-                quip["description"] = self.localize.get(entry.get("transcript"))
-                quip["operatorId"] = self.ModernWarfare.GetOperatorID(
-                    entry.get("operatorRef")
-                )
-                quip["operatorAltId"] = entry.get("operatorRef")
-                quip["image"] = entry.get("lootImage")
+        for quip, entry in Utility.JoinTable(self, quips, "altId", table, "ref"):
+            quip["name"] = self.localize.get(entry.get("name"))
+            quip["description"] = self.localize.get(entry.get("transcript"))
+            quip["operatorId"] = self.ModernWarfare.GetOperatorID(
+                entry.get("operatorRef")
+            )
+            quip["operatorAltId"] = entry.get("operatorRef")
+            quip["image"] = entry.get("lootImage")
 
         return quips
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -42,6 +42,13 @@ class ReticleTable(TypedDict):
 class Reticles:
     """Reticle XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/reticle_ids.csv",
+        "{iXAssets}/mp/reticletable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/reticles.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Reticle XAssets."""
 
@@ -50,15 +57,15 @@ class Reticles:
         reticles = Reticles.IDs(self, reticles)
         reticles = Reticles.Table(self, reticles)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/reticles.json", reticles)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/reticles.json", reticles)
 
         log.info(f"Compiled {len(reticles):,} Reticles")
 
     def IDs(self: Any, reticles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/reticle_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/reticle_ids.csv", ReticleIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/reticle_ids.csv", ReticleIDs
         )
 
         if ids is None:
@@ -88,21 +95,17 @@ class Reticles:
     def Table(self: Any, reticles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/reticletable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/reticletable.csv", ReticleTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/reticletable.csv", ReticleTable
         )
 
         if table is None:
             return reticles
 
-        for reticle in reticles:
-            for entry in table:
-                if reticle.get("altId") != entry.get("ref"):
-                    continue
-
-                reticle["name"] = self.localize.get(entry.get("name"))
-                reticle["description"] = self.localize.get(entry.get("desc"))
-                reticle["hidden"] = bool(entry.get("hideInUI"))
-                reticle["image"] = entry.get("image")
+        for reticle, entry in Utility.JoinTable(self, reticles, "altId", table, "ref"):
+            reticle["name"] = self.localize.get(entry.get("name"))
+            reticle["description"] = self.localize.get(entry.get("desc"))
+            reticle["hidden"] = bool(entry.get("hideInUI"))
+            reticle["image"] = entry.get("image")
 
         return reticles
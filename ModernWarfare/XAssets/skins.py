@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -55,6 +55,13 @@ class OperatorSkins(TypedDict):
 class Skins:
     """Skin XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/operator_skin_ids.csv",
+        "{iXAssets}/operatorskins.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operatorSkins.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources", "operatorIds"]
+
     def Compile(self: Any) -> None:
         """Compile the Skin XAssets."""
 
@@ -63,15 +70,15 @@ class Skins:
         skins = Skins.IDs(self, skins)
         skins = Skins.Table(self, skins)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/operatorSkins.json", skins)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/operatorSkins.json", skins)
 
         log.info(f"Compiled {len(skins):,} Operator Skins")
 
     def IDs(self: Any, skins: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operator_skin_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/operator_skin_ids.csv", OperatorSkinIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/operator_skin_ids.csv", OperatorSkinIDs
         )
 
         if ids is None:
@@ -105,33 +112,29 @@ class Skins:
     def Table(self: Any, skins: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the operatorskins.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/operatorskins.csv", OperatorSkins
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/operatorskins.csv", OperatorSkins
         )
 
         if table is None:
             return skins
 
-        for skin in skins:
-            for entry in table:
-                if skin.get("altId") != entry.get("ref"):
-                    continue
+        for skin, entry in Utility.JoinTable(self, skins, "altId", table, "ref"):
+            skin["name"] = self.localize.get(entry.get("name"))
+            skin["description"] = self.localize.get(entry.get("desc"))
+            skin["image"] = entry.get("lootImage")
+            skin["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
 
-                skin["name"] = self.localize.get(entry.get("name"))
-                skin["description"] = self.localize.get(entry.get("desc"))
-                skin["image"] = entry.get("lootImage")
-                skin["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
+            if bool(entry.get("isGlobal")) is True:
+                skin["operatorId"] = self.ModernWarfare.GetOperatorID(
+                    "universal_base_ref"
                 )
-
-                if bool(entry.get("isGlobal")) is True:
-                    skin["operatorId"] = self.ModernWarfare.GetOperatorID(
-                        "universal_base_ref"
-                    )
-                    skin["operatorAltId"] = "universal_base_ref"
-                else:
-                    ref: str = entry.get("operatorRef")
-                    skin["operatorId"] = self.ModernWarfare.GetOperatorID(ref)
-                    skin["operatorAltId"] = ref
+                skin["operatorAltId"] = "universal_base_ref"
+            else:
+                ref: str = entry.get("operatorRef")
+                skin["operatorId"] = self.ModernWarfare.GetOperatorID(ref)
+                skin["operatorAltId"] = ref
 
         return skins
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -20,6 +20,10 @@ class SpecialIDs(TypedDict):
 class SpecialItems:
     """Special Item XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/special_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/specialItems.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Special Item XAssets."""
 
@@ -27,15 +31,15 @@ class SpecialItems:
 
         items = SpecialItems.IDs(self, items)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/specialItems.json", items)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/specialItems.json", items)
 
         log.info(f"Compiled {len(items):,} Special Items")
 
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/special_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/special_ids.csv", SpecialIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/special_ids.csv", SpecialIDs
         )
 
         if ids is None:
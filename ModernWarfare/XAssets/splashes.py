@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -45,6 +45,10 @@ class SplashTable(TypedDict):
 class Splashes:
     """Splash XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp/splashtable.csv"]
+    outputs: List[str] = ["{eXAssets}/splashes.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Splash XAssets."""
 
@@ -52,15 +56,15 @@ class Splashes:
 
         splashes = Splashes.Table(self, splashes)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/splashes.json", splashes)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/splashes.json", splashes)
 
         log.info(f"Compiled {len(splashes):,} Splashes")
 
     def Table(self: Any, splashes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/splashtable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/splashtable.csv", SplashTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/splashtable.csv", SplashTable
         )
 
         if table is None:
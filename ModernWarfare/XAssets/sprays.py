@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -34,6 +34,13 @@ class SprayTable(TypedDict):
 class Sprays:
     """Spray XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/sprays_ids.csv",
+        "{iXAssets}/mp/spraytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/sprays.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Spray XAssets."""
 
@@ -42,15 +49,15 @@ class Sprays:
         sprays = Sprays.IDs(self, sprays)
         sprays = Sprays.Table(self, sprays)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/sprays.json", sprays)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/sprays.json", sprays)
 
         log.info(f"Compiled {len(sprays):,} Sprays")
 
     def IDs(self: Any, sprays: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/sprays_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/sprays_ids.csv", SpraysIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/sprays_ids.csv", SpraysIDs
         )
 
         if ids is None:
@@ -79,20 +86,16 @@ class Sprays:
     def Table(self: Any, sprays: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/spraytable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/spraytable.csv", SprayTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/spraytable.csv", SprayTable
         )
 
         if table is None:
             return sprays
 
-        for spray in sprays:
-            for entry in table:
-                if spray.get("altId") != entry.get("ref"):
-                    continue
-
-                spray["name"] = self.localize.get(entry.get("name"))
-                spray["hidden"] = bool(entry.get("hideInUI"))
-                spray["image"] = entry.get("image")
+        for spray, entry in Utility.JoinTable(self, sprays, "altId", table, "ref"):
+            spray["name"] = self.localize.get(entry.get("name"))
+            spray["hidden"] = bool(entry.get("hideInUI"))
+            spray["image"] = entry.get("image")
 
         return sprays
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -23,7 +23,7 @@ class WeaponStickerTable(TypedDict):
 
     index: int
     ref: str
-    unknown1: str # Previously defined in luashared/csvutils.lua as netConstID
+    unknown1: str  # Previously defined in luashared/csvutils.lua as netConstID
     name: str
     image: str
     category: str
@@ -38,6 +38,13 @@ class WeaponStickerTable(TypedDict):
 class Stickers:
     """Sticker XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/sticker_ids.csv",
+        "{iXAssets}/mp/weaponstickertable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/stickers.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Sticker XAssets."""
 
@@ -46,15 +53,15 @@ class Stickers:
         stickers = Stickers.IDs(self, stickers)
         stickers = Stickers.Table(self, stickers)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/stickers.json", stickers)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/stickers.json", stickers)
 
         log.info(f"Compiled {len(stickers):,} Weapon Stickers")
 
     def IDs(self: Any, stickers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/sticker_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/sticker_ids.csv", StickerIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/sticker_ids.csv", StickerIDs
         )
 
         if ids is None:
@@ -85,24 +92,20 @@ class Stickers:
     def Table(self: Any, stickers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/weaponstickertable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/weaponstickertable.csv", WeaponStickerTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/weaponstickertable.csv", WeaponStickerTable
         )
 
         if table is None:
             return stickers
 
-        for sticker in stickers:
-            for entry in table:
-                if sticker.get("altId") != entry.get("ref"):
-                    continue
-
-                sticker["name"] = self.localize.get(entry.get("name"))
-                sticker["flavor"] = self.localize.get(entry.get("storeFlavor"))
-                sticker["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
-                    entry.get("platformExclusiveType")
-                )
-                sticker["hidden"] = bool(entry.get("hideInUI"))
-                sticker["image"] = entry.get("image")
+        for sticker, entry in Utility.JoinTable(self, stickers, "altId", table, "ref"):
+            sticker["name"] = self.localize.get(entry.get("name"))
+            sticker["flavor"] = self.localize.get(entry.get("storeFlavor"))
+            sticker["exclusive"] = self.ModernWarfare.GetPlatformExclusivity(
+                entry.get("platformExclusiveType")
+            )
+            sticker["hidden"] = bool(entry.get("hideInUI"))
+            sticker["image"] = entry.get("image")
 
         return stickers
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -23,6 +23,10 @@ class T9UnlockItems(TypedDict):
 class UnlockItemsT9:
     """Unlock Item XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/loot/t9_unlock_items.csv"]
+    outputs: List[str] = ["{eXAssets}/unlockItemsT9.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Unlock Item XAssets."""
 
@@ -30,15 +34,15 @@ class UnlockItemsT9:
 
         unlocks = UnlockItemsT9.Table(self, unlocks)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/unlockItemsT9.json", unlocks)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/unlockItemsT9.json", unlocks)
 
         log.info(f"Compiled {len(unlocks):,} T9 Unlock Items")
 
     def Table(self: Any, unlocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/t9_unlock_items.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/t9_unlock_items.csv", T9UnlockItems
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/t9_unlock_items.csv", T9UnlockItems
         )
 
         if table is None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -40,6 +40,13 @@ class VehicleCamosTable(TypedDict):
 class VehicleCamos:
     """Vehicle Camo XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_camo_ids.csv",
+        "{iXAssets}/mp_cp/vehiclecamos.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleCamos.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Vehicle Camo XAssets."""
 
@@ -48,15 +55,15 @@ class VehicleCamos:
         camos = VehicleCamos.IDs(self, camos)
         camos = VehicleCamos.Table(self, camos)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/vehicleCamos.json", camos)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/vehicleCamos.json", camos)
 
         log.info(f"Compiled {len(camos):,} Vehicle Camos")
 
     def IDs(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_camo_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/vehicle_camo_ids.csv", VehicleCamoIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/vehicle_camo_ids.csv", VehicleCamoIDs
         )
 
         if ids is None:
@@ -88,33 +95,27 @@ class VehicleCamos:
     def Table(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/vehiclecamos.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp_cp/vehiclecamos.csv", VehicleCamosTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp_cp/vehiclecamos.csv", VehicleCamosTable
         )
 
         if table is None:
             return camos
 
-        for camo in camos:
-            for entry in table:
-                if camo.get("altId") != entry.get("ref"):
-                    continue
-
-                camo["name"] = self.localize.get(entry.get("name"))
-                camo["flavor"] = self.localize.get(entry.get("flavorText"))
-                camo["unlock"] = (
-                    None
-                    if (loc := self.localize.get(entry.get("unlockText"))) is None
-                    else loc.replace("&&1 ", "")
-                )
-                camo["attribute"] = self.ModernWarfare.GetAttribute(
-                    entry.get("specialAttribute")
-                )
-                camo["hidden"] = bool(entry.get("hideInUI"))
-                camo["image"] = (
-                    None
-                    if (i := entry.get("showcaseImage")) == "ui_default_white"
-                    else i
-                )
+        for camo, entry in Utility.JoinTable(self, camos, "altId", table, "ref"):
+            camo["name"] = self.localize.get(entry.get("name"))
+            camo["flavor"] = self.localize.get(entry.get("flavorText"))
+            camo["unlock"] = (
+                None
+                if (loc := self.localize.get(entry.get("unlockText"))) is None
+                else loc.replace("&&1 ", "")
+            )
+            camo["attribute"] = self.ModernWarfare.GetAttribute(
+                entry.get("specialAttribute")
+            )
+            camo["hidden"] = bool(entry.get("hideInUI"))
+            camo["image"] = (
+                None if (i := entry.get("showcaseImage")) == "ui_default_white" else i
+            )
 
         return camos
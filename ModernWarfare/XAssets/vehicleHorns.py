@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -47,6 +47,13 @@ class VehicleHornsTable(TypedDict):
 class VehicleHorns:
     """Vehicle Horn XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_horn_ids.csv",
+        "{iXAssets}/mp_cp/vehiclehorns.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleHorns.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Vehicle Horn XAssets."""
 
@@ -55,15 +62,15 @@ class VehicleHorns:
         horns = VehicleHorns.IDs(self, horns)
         horns = VehicleHorns.Table(self, horns)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/vehicleHorns.json", horns)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/vehicleHorns.json", horns)
 
         log.info(f"Compiled {len(horns):,} Vehicle Horns")
 
     def IDs(self: Any, horns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_horn_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/vehicle_horn_ids.csv", VehicleHornIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/vehicle_horn_ids.csv", VehicleHornIDs
         )
 
         if ids is None:
@@ -94,23 +101,19 @@ class VehicleHorns:
     def Table(self: Any, horns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/vehiclehorns.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp_cp/vehiclehorns.csv", VehicleHornsTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp_cp/vehiclehorns.csv", VehicleHornsTable
         )
 
         if table is None:
             return horns
 
-        for horn in horns:
-            for entry in table:
-                if horn.get("altId") != entry.get("ref"):
-                    continue
-
-                horn["name"] = self.localize.get(entry.get("name"))
-                horn["flavor"] = self.localize.get(entry.get("flavorText"))
-                horn["unlock"] = self.localize.get(entry.get("unlockText")).replace(
-                    "&&1 ", ""
-                )
-                horn["hidden"] = bool(entry.get("hideInUI"))
+        for horn, entry in Utility.JoinTable(self, horns, "altId", table, "ref"):
+            horn["name"] = self.localize.get(entry.get("name"))
+            horn["flavor"] = self.localize.get(entry.get("flavorText"))
+            horn["unlock"] = self.localize.get(entry.get("unlockText")).replace(
+                "&&1 ", ""
+            )
+            horn["hidden"] = bool(entry.get("hideInUI"))
 
         return horns
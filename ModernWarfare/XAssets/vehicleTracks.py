@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -39,6 +39,13 @@ class VehicleTracksTable(TypedDict):
 class VehicleTracks:
     """Vehicle Tracks XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_track_ids.csv",
+        "{iXAssets}/mp_cp/vehicletracks.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleTracks.json"]
+    shared: List[str] = ["localize", "lootTypes", "itemSources"]
+
     def Compile(self: Any) -> None:
         """Compile the Vehicle Track XAssets."""
 
@@ -47,15 +54,15 @@ class VehicleTracks:
         tracks = VehicleTracks.IDs(self, tracks)
         tracks = VehicleTracks.Table(self, tracks)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/vehicleTracks.json", tracks)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/vehicleTracks.json", tracks)
 
         log.info(f"Compiled {len(tracks):,} Vehicle Tracks")
 
     def IDs(self: Any, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_track_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/vehicle_track_ids.csv", VehicleTrackIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/vehicle_track_ids.csv", VehicleTrackIDs
         )
 
         if ids is None:
@@ -85,22 +92,18 @@ class VehicleTracks:
     def Table(self: Any, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/vehicletracks.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp_cp/vehicletracks.csv", VehicleTracksTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp_cp/vehicletracks.csv", VehicleTracksTable
         )
 
         if table is None:
             return tracks
 
-        for track in tracks:
-            for entry in table:
-                if track.get("altId") != entry.get("ref"):
-                    continue
-
-                track["name"] = self.localize.get(entry.get("name"))
-                track["unlock"] = self.localize.get(entry.get("unlockText")).replace(
-                    "&&1 ", ""
-                )
-                track["hidden"] = bool(entry.get("hideInUI"))
+        for track, entry in Utility.JoinTable(self, tracks, "altId", table, "ref"):
+            track["name"] = self.localize.get(entry.get("name"))
+            track["unlock"] = self.localize.get(entry.get("unlockText")).replace(
+                "&&1 ", ""
+            )
+            track["hidden"] = bool(entry.get("hideInUI"))
 
         return tracks
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Mapping, Tuple, TypedDict
 
 from utility import Utility
 
@@ -22,6 +22,10 @@ class VehicleTable(TypedDict):
 class Vehicles:
     """Vehicle XAssets."""
 
+    inputs: List[str] = ["{iXAssets}/mp_cp/vehicletable.csv"]
+    outputs: List[str] = ["{eXAssets}/vehicles.json"]
+    shared: List[str] = ["localize"]
+
     def Compile(self: Any) -> None:
         """Compile the Vehicle XAssets."""
 
@@ -29,15 +33,15 @@ class Vehicles:
 
         vehicles = Vehicles.Table(self, vehicles)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/vehicles.json", vehicles)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/vehicles.json", vehicles)
 
         log.info(f"Compiled {len(vehicles):,} Vehicles")
 
     def Table(self: Any, vehicles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/vehicletable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp_cp/vehicletable.csv", VehicleTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp_cp/vehicletable.csv", VehicleTable
         )
 
         if table is None:
@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Dict, List, TypedDict, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypedDict, Union
 
-from utility import Utility
+from utility import DirectoryIndex, Utility
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -185,6 +185,23 @@ class AttachmentTable(TypedDict):
 class Weapons:
     """Weapon XAssets."""
 
+    inputs: List[str] = [
+        "{iXAssets}/mp/statstable.csv",
+        "{iXAssets}/loot/weapon_ids.csv",
+        "{iXAssets}/mp/gunsmith/*_variants.csv",
+        "{iXAssets}/mp/gunsmith/*_progression.csv",
+        "{iXAssets}/loot/*_attachment_ids.csv",
+        "{iXAssets}/mp/attachmenttable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/weapons.json"]
+    shared: List[str] = [
+        "localize",
+        "lootTypes",
+        "itemSources",
+        "weaponClasses",
+        "attachCategories",
+    ]
+
     def Compile(self: Any) -> None:
         """Compile the Weapon XAssets."""
 
@@ -192,20 +209,22 @@ class Weapons:
 
         weapons = Weapons.Table(self, weapons)
         weapons = Weapons.IDs(self, weapons)
-        weapons = Weapons.Variants(self, weapons)
-        weapons = Weapons.Progression(self, weapons)
+        gunsmith: Dict[str, Dict[str, Any]] = Weapons.Gunsmith(self, weapons)
+
+        weapons = Weapons.Variants(self, weapons, gunsmith)
+        weapons = Weapons.Progression(self, weapons, gunsmith)
         weapons = Weapons.Attachments(self, weapons)
         weapons = Weapons.AttachmentTable(self, weapons)
 
-        Utility.WriteFile(self, f"{self.eXAssets}/weapons.json", weapons)
+        Utility.ExportXAsset(self, f"{self.eXAssets}/weapons.json", weapons)
 
         log.info(f"Compiled {len(weapons):,} Weapons")
 
     def Table(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/statstable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/statstable.csv", StatsTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/statstable.csv", StatsTable
         )
 
         for entry in table:
@@ -269,261 +288,310 @@ class Weapons:
     def IDs(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/weapon_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/weapon_ids.csv", WeaponIDs
+        ids: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/weapon_ids.csv", WeaponIDs
         )
 
         if ids is None:
             return weapons
 
-        for weapon in weapons:
-            for entry in ids:
-                if weapon.get("altId") != entry.get("baseRef"):
-                    continue
-
-                if entry.get("quality") == 0:
-                    weapon["id"] = entry.get("index")
-                    weapon["type"] = self.ModernWarfare.GetLootType(entry.get("index"))
-                    weapon["rarity"] = self.ModernWarfare.GetLootRarity(
-                        entry.get("quality")
-                    )
-                    weapon["season"] = self.ModernWarfare.GetLootSeason(
-                        entry.get("license")
-                    )
-                    weapon["available"] = self.ModernWarfare.GetTitleAvailability(
-                        entry.get("index")
-                    )
-                else:
-                    weapon["variants"].append(
-                        {
-                            "id": entry.get("index"),
-                            "altId": entry.get("variantRef"),
-                            "name": None,
-                            "flavor": None,
-                            "type": self.ModernWarfare.GetLootType(entry.get("index")),
-                            "rarity": self.ModernWarfare.GetLootRarity(
-                                entry.get("quality")
-                            ),
-                            "season": self.ModernWarfare.GetLootSeason(
-                                entry.get("license")
-                            ),
-                            "available": self.ModernWarfare.GetTitleAvailability(
-                                entry.get("index")
-                            ),
-                            "tracers": None,
-                            "dismemberment": None,
-                            "image": None,
-                        }
-                    )
+        for weapon, entry in Utility.JoinTable(
+            self, weapons, "altId", ids, "baseRef", many=True
+        ):
+            if entry.get("quality") == 0:
+                weapon["id"] = entry.get("index")
+                weapon["type"] = self.ModernWarfare.GetLootType(entry.get("index"))
+                weapon["rarity"] = self.ModernWarfare.GetLootRarity(
+                    entry.get("quality")
+                )
+                weapon["season"] = self.ModernWarfare.GetLootSeason(
+                    entry.get("license")
+                )
+                weapon["available"] = self.ModernWarfare.GetTitleAvailability(
+                    entry.get("index")
+                )
+            else:
+                weapon["variants"].append(
+                    {
+                        "id": entry.get("index"),
+                        "altId": entry.get("variantRef"),
+                        "name": None,
+                        "flavor": None,
+                        "type": self.ModernWarfare.GetLootType(entry.get("index")),
+                        "rarity": self.ModernWarfare.GetLootRarity(
+                            entry.get("quality")
+                        ),
+                        "season": self.ModernWarfare.GetLootSeason(
+                            entry.get("license")
+                        ),
+                        "available": self.ModernWarfare.GetTitleAvailability(
+                            entry.get("index")
+                        ),
+                        "tracers": None,
+                        "dismemberment": None,
+                        "image": None,
+                    }
+                )
 
         return weapons
 
-    def Variants(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Compile the mp/gunsmith/*_*_variants.csv XAssets."""
+    def Gunsmith(self: Any, weapons: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse the mp/gunsmith/*_*_variants.csv and *_*_progression.csv
+        XAssets of every weapon once and index the variant rows of each
+        weapon by reference.
+        """
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/mp/gunsmith/", "csv", None, "_variants"
+        path: str = f"{self.iXAssets}/mp/gunsmith"
+        variants: Dict[str, List[str]] = Weapons.GetFiles(
+            self, weapons, path, "iw8_", "_variants"
+        )
+        progression: Dict[str, List[str]] = Weapons.GetFiles(
+            self, weapons, path, "iw8_", "_progression"
         )
 
-        for weapon in weapons:
-            if (altId := weapon.get("altId")) is None:
-                continue
+        files: Dict[str, Any] = {}
 
-            for file in files:
-                refPartial: str = altId.replace("iw8_", "") + "_"
-                filePartial: str = file.split("\\")[-1].split(".")[0]
+        for altId in variants:
+            files.update({file: WeaponVariants for file in variants[altId]})
+            files.update({file: WeaponProgression for file in progression[altId]})
 
-                if filePartial.startswith(refPartial) is False:
-                    continue
+        tables: Dict[str, Tuple[Mapping[str, Any], ...]] = {
+            file: self.tables.Read(file, table) for file, table in files.items()
+        }
 
-                table: List[Dict[str, Any]] = Utility.ReadCSV(
-                    self, file, WeaponVariants
-                )
+        gunsmith: Dict[str, Dict[str, Any]] = {}
 
-                if table is None:
-                    continue
+        for altId in variants:
+            loaded: Dict[str, Any] = {"variants": {}, "progression": []}
 
-                for entry in table:
+            # Later rows replace earlier rows, as files are read in name order
+            for file in variants[altId]:
+                for entry in tables[file]:
                     if entry.get("variantID") == 0:
-                        weapon["image"] = entry.get("image")
-
-                    for variant in weapon.get("variants", []):
-                        if variant.get("altId") != entry.get("ref"):
-                            continue
+                        loaded["image"] = entry.get("image")
 
-                        flavor: str = (
-                            variant.get("altId")
-                            .replace("iw8_", "")
-                            .replace("variant_", "")
-                        )
+                    loaded["variants"][entry.get("ref")] = entry
 
-                        variant["name"] = self.localize.get(entry.get("name"))
-                        variant["flavor"] = self.localize.get(
-                            f"WEAPON_FLAVOR/{flavor.upper()}_FLAVOR"
-                        )
-                        variant["tracers"] = self.ModernWarfare.GetAttribute(
-                            entry.get("tracerColor")
-                        )
-                        variant["dismemberment"] = self.ModernWarfare.GetAttribute(
-                            entry.get("dismembermentEnabled")
-                        )
-                        variant["image"] = entry.get("image")
+            for file in progression[altId]:
+                loaded["progression"].extend(tables[file])
 
-        return weapons
+            gunsmith[altId] = loaded
 
-    def Progression(self, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Compile the mp/gunsmith/*_*_progression.csv XAssets."""
+        return gunsmith
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/mp/gunsmith/", "csv", None, "_progression"
-        )
+    def Variants(
+        self: Any, weapons: List[Dict[str, Any]], gunsmith: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Compile the mp/gunsmith/*_*_variants.csv XAssets."""
 
         for weapon in weapons:
-            if (wAltId := weapon.get("altId")) is None:
+            if (altId := weapon.get("altId")) is None:
                 continue
 
-            for file in files:
-                refPartial: str = wAltId.replace("iw8_", "") + "_"
-                filePartial: str = file.split("\\")[-1].split(".")[0]
+            loaded: Dict[str, Any] = gunsmith[altId]
 
-                if filePartial.startswith(refPartial) is False:
+            if "image" in loaded:
+                weapon["image"] = loaded.get("image")
+
+            for variant in weapon.get("variants", []):
+                if (entry := loaded["variants"].get(variant.get("altId"))) is None:
                     continue
 
-                table: List[Dict[str, Any]] = Utility.ReadCSV(
-                    self, file, WeaponProgression
+                flavor: str = (
+                    variant.get("altId").replace("iw8_", "").replace("variant_", "")
                 )
 
-                if table is None:
-                    continue
+                variant["name"] = self.localize.get(entry.get("name"))
+                variant["flavor"] = self.localize.get(
+                    f"WEAPON_FLAVOR/{flavor.upper()}_FLAVOR"
+                )
+                variant["tracers"] = self.ModernWarfare.GetAttribute(
+                    entry.get("tracerColor")
+                )
+                variant["dismemberment"] = self.ModernWarfare.GetAttribute(
+                    entry.get("dismembermentEnabled")
+                )
+                variant["image"] = entry.get("image")
 
-                for entry in table:
-                    if entry.get("lootID") is None:
-                        continue
-                    elif entry.get("level") < 0:
-                        continue
+        return weapons
 
-                    weapon["attachments"].append(
-                        {
-                            "id": Utility.GetCSVArray(self, entry.get("lootID"), int)[
-                                0
-                            ],
-                            "altId": None,
-                            "name": None,
-                            "description": None,
-                            "type": None,
-                            "unlock": entry.get("level"),
-                            "image": None,
-                            "background": "ui_loot_bg_generic",
-                            "attributes": [],
-                            "statBars": [],
-                        }
-                    )
+    def Progression(
+        self: Any, weapons: List[Dict[str, Any]], gunsmith: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Compile the mp/gunsmith/*_*_progression.csv XAssets."""
+
+        for weapon in weapons:
+            if (wAltId := weapon.get("altId")) is None:
+                continue
+
+            for entry in gunsmith[wAltId]["progression"]:
+                if entry.get("lootID") is None:
+                    continue
+                elif entry.get("level") < 0:
+                    continue
+
+                weapon["attachments"].append(
+                    {
+                        "id": Utility.GetCSVArray(self, entry.get("lootID"), int)[0],
+                        "altId": None,
+                        "name": None,
+                        "description": None,
+                        "type": None,
+                        "unlock": entry.get("level"),
+                        "image": None,
+                        "background": "ui_loot_bg_generic",
+                        "attributes": [],
+                        "statBars": [],
+                    }
+                )
 
         return weapons
 
     def Attachments(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/iw8_*_*_attachment_ids.csv XAssets."""
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/loot/", "csv", None, "_attachment_ids"
+        files: Dict[str, List[str]] = Weapons.GetFiles(
+            self, weapons, f"{self.iXAssets}/loot", "", "_attachment_ids"
         )
 
         for weapon in weapons:
             if (wAltId := weapon.get("altId")) is None:
                 continue
 
-            for file in files:
-                filePartial: str = file.split("\\")[-1].split(".")[0]
+            refs: Dict[int, str] = {}
 
-                if filePartial.startswith(wAltId + "_") is False:
-                    continue
+            # Later files and rows replace earlier ones for the same index
+            for file in files[wAltId]:
+                for entry in self.tables.Read(file, AttachmentIDs):
+                    if (ref := entry.get("ref")) is not None:
+                        refs[entry.get("index")] = ref
 
-                table: List[Dict[str, Any]] = Utility.ReadCSV(self, file, AttachmentIDs)
+            for attachment in weapon.get("attachments"):
+                if (ref := refs.get(attachment.get("id"))) is not None:
+                    attachment["altId"] = ref
 
-                if table is None:
-                    continue
+        return weapons
 
-                for attachment in weapon.get("attachments"):
-                    for entry in table:
-                        if entry.get("ref") is None:
-                            continue
-                        elif attachment.get("id") != entry.get("index"):
-                            continue
+    def GetFiles(
+        self: Any, weapons: List[Dict[str, Any]], path: str, strip: str, end: str
+    ) -> Dict[str, List[str]]:
+        """
+        Map the altId of each weapon to the csv files in the specified
+        directory whose name begins with the altId, less strip, and ends
+        with the desired suffix.
+        """
 
-                        attachment["altId"] = entry.get("ref")
+        index: DirectoryIndex = Utility.GetDirectory(self, path)
+        files: Dict[str, List[str]] = {}
 
-        return weapons
+        for weapon in weapons:
+            if (altId := weapon.get("altId")) is None:
+                continue
+
+            files[altId] = index.Match(f"{altId.replace(strip, '')}_", end, "csv")
+
+        return files
 
     def AttachmentTable(
         self: Any, weapons: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Compile the mp/attachmenttable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/attachmenttable.csv", AttachmentTable
+        table: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/attachmenttable.csv", AttachmentTable
         )
 
         if table is None:
             return weapons
 
+        rows: Dict[str, List[int]] = {}
+        resolved: Dict[int, Dict[str, Any]] = {}
+        stats: List[Tuple[Optional[str], str]] = [
+            (self.localize.get("LUA_MENU/WEAPSTATS_ACCURACY"), "acc"),
+            (self.localize.get("LUA_MENU/WEAPSTATS_DAMAGE"), "dam"),
+            (self.localize.get("LUA_MENU/WEAPSTATS_RANGE"), "rng"),
+            (self.localize.get("LUA_MENU/WEAPSTATS_ROF"), "rof"),
+            (self.localize.get("LUA_MENU/WEAPSTATS_MOBILITY"), "mob"),
+            (self.localize.get("LUA_MENU/WEAPSTATS_CONTROL"), "ctl"),
+        ]
+
+        for position, entry in enumerate(table):
+            rows.setdefault(entry.get("ref"), []).append(position)
+
         for weapon in weapons:
+            weaponPartial: str = weapon.get("altId").split("_")[-1]
+
             for attachment in weapon.get("attachments"):
-                if attachment.get("altId") is None:
+                if (altId := attachment.get("altId")) is None:
                     continue
 
-                for entry in table:
-                    weaponPartial: str = weapon.get("altId").split("_")[-1]
-
-                    if attachment.get("altId") + "_" + weaponPartial == entry.get(
-                        "ref"
-                    ):
-                        pass
-                    elif attachment.get("altId") == entry.get("ref"):
-                        pass
-                    else:
-                        continue
-
-                    attachment["name"] = self.localize.get(entry.get("name"))
-                    attachment["description"] = self.localize.get(entry.get("desc"))
-                    attachment["type"] = self.ModernWarfare.GetAttachmentCategory(
-                        entry.get("category")
+                # Every row matching either the weapon-specific or the
+                # generic reference applies, in table order.
+                positions: List[int] = sorted(
+                    rows.get(f"{altId}_{weaponPartial}", []) + rows.get(altId, [])
+                )
+
+                for position in positions:
+                    if (values := resolved.get(position)) is None:
+                        values = resolved[position] = Weapons.ResolveAttachment(
+                            self, table[position], stats
+                        )
+
+                    attachment["name"] = values.get("name")
+                    attachment["description"] = values.get("description")
+                    attachment["type"] = values.get("type")
+                    attachment["image"] = values.get("image")
+                    attachment["attributes"].extend(
+                        dict(attribute) for attribute in values.get("attributes")
+                    )
+                    attachment["statBars"].extend(
+                        dict(statBar) for statBar in values.get("statBars")
                     )
-                    attachment["image"] = entry.get("image")
 
-                    for i in range(1, 9):
-                        if (mod := entry.get(f"modifier{i}")) is None:
-                            continue
+        return weapons
 
-                        mod: List[str] = mod.split("|")
-                        modVal: Union[int, str] = int(mod[1])
+    def ResolveAttachment(
+        self: Any,
+        entry: Mapping[str, Any],
+        stats: List[Tuple[Optional[str], str]],
+    ) -> Dict[str, Any]:
+        """
+        Resolve the values which an mp/attachmenttable.csv row applies to
+        each matching attachment.
+        """
+
+        values: Dict[str, Any] = {
+            "name": self.localize.get(entry.get("name")),
+            "description": self.localize.get(entry.get("desc")),
+            "type": self.ModernWarfare.GetAttachmentCategory(entry.get("category")),
+            "image": entry.get("image"),
+            "attributes": [],
+            "statBars": [],
+        }
+
+        for i in range(1, 9):
+            if (mod := entry.get(f"modifier{i}")) is None:
+                continue
 
-                        if modVal == 1:
-                            modVal = "+"
-                        elif modVal == -1:
-                            modVal = "-"
+            mod: List[str] = mod.split("|")
+            modVal: Union[int, str] = int(mod[1])
 
-                        attachment["attributes"].append(
-                            {"label": self.localize.get(mod[0]), "value": modVal}
-                        )
+            if modVal == 1:
+                modVal = "+"
+            elif modVal == -1:
+                modVal = "-"
 
-                    statLabels: List[str] = [
-                        "LUA_MENU/WEAPSTATS_ACCURACY",
-                        "LUA_MENU/WEAPSTATS_DAMAGE",
-                        "LUA_MENU/WEAPSTATS_RANGE",
-                        "LUA_MENU/WEAPSTATS_ROF",
-                        "LUA_MENU/WEAPSTATS_MOBILITY",
-                        "LUA_MENU/WEAPSTATS_CONTROL",
-                    ]
-                    statValues: List[str] = ["acc", "dam", "rng", "rof", "mob", "ctl"]
-
-                    for label, value in zip(statLabels, statValues):
-                        if (value := entry.get(value)) is None:
-                            continue
-                        elif value == 0.0:
-                            continue
-
-                        attachment["statBars"].append(
-                            {"label": self.localize.get(label), "value": value}
-                        )
+            values["attributes"].append(
+                {"label": self.localize.get(mod[0]), "value": modVal}
+            )
 
-        return weapons
+        for label, column in stats:
+            if (value := entry.get(column)) is None:
+                continue
+            elif value == 0.0:
+                continue
+
+            values["statBars"].append({"label": label, "value": value})
+
+        return values
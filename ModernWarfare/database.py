@@ -1,5 +1,11 @@
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import sqlite3
+from contextlib import closing
+from heapq import merge
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from utility import Utility
 
@@ -12,6 +18,47 @@ class Database:
     https://cod.tracker.gg/warzone/db
     """
 
+    inputs: List[str] = [
+        "{eXAssets}/accessories.json",
+        "{eXAssets}/battlePasses.json",
+        "{eXAssets}/battlePassItems.json",
+        "{eXAssets}/bundles.json",
+        "{eXAssets}/callingCards.json",
+        "{eXAssets}/camos.json",
+        "{eXAssets}/charms.json",
+        "{eXAssets}/consumables.json",
+        "{eXAssets}/dlc.json",
+        "{eXAssets}/emblems.json",
+        "{eXAssets}/executions.json",
+        "{eXAssets}/features.json",
+        "{eXAssets}/gestures.json",
+        "{eXAssets}/missionItems.json",
+        "{eXAssets}/operatorQuips.json",
+        "{eXAssets}/operators.json",
+        "{eXAssets}/operatorSkins.json",
+        "{eXAssets}/reticles.json",
+        "{eXAssets}/specialItems.json",
+        "{eXAssets}/sprays.json",
+        "{eXAssets}/stickers.json",
+        "{eXAssets}/unlockItemsT9.json",
+        "{eXAssets}/vehicleCamos.json",
+        "{eXAssets}/vehicleHorns.json",
+        "{eXAssets}/vehicleTracks.json",
+        "{eXAssets}/weapons.json",
+    ]
+    outputs: List[str] = [
+        "{eDatabase}/_images.txt",
+        "{eDatabase}/battlePasses.json",
+        "{eDatabase}/bundles.json",
+        "{eDatabase}/loot.json",
+        "{eDatabase}/operators.json",
+        "{eDatabase}/weapons.json",
+    ]
+    shared: List[str] = ["localize"]
+
+    # Also reads the images directory, which is not tracked by manifests
+    incremental: bool = False
+
     def Compile(self: Any) -> None:
         """Compile the XAssets for the COD Tracker Database."""
 
@@ -40,6 +87,12 @@ class Database:
 
         Utility.WriteFile(self, f"{self.eDatabase}/_images.txt", imgWhole)
 
+        if self.config.get("compileSQLite") is True:
+            DBSQLite.Compile(self)
+
+        self.sprites.Wait()
+        Utility.GetImages(self).Save()
+
         log.info(f"Compiled {self.count:,} Database Items")
 
 
@@ -50,7 +103,7 @@ class DBBattlePasses:
         """Compile the Battle Pass XAssets for the COD Tracker Database."""
 
         dbPasses: List[Dict[str, Any]] = []
-        passes: List[Dict[str, Any]] = Utility.ReadFile(
+        passes: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/battlePasses.json"
         )
 
@@ -61,21 +114,20 @@ class DBBattlePasses:
             items: List[Dict[str, Any]] = []
 
             for item in battlePass.get("items"):
+                item = dict(item)
+
                 item.pop("type")
                 item.pop("billboard")
 
                 items.append(item)
 
+            battlePass = dict(battlePass)
+            battlePass["items"] = items
+
             dbPasses.append(battlePass)
             self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/battlePasses.json",
-            dbPasses,
-            compress=True,
-        )
-        Utility.WriteFile(self, f"{self.eDatabase}/_battlePasses.json", dbPasses)
+        Utility.WriteDatabase(self, f"{self.eDatabase}/battlePasses.json", dbPasses)
 
 
 class DBBundles:
@@ -85,10 +137,12 @@ class DBBundles:
         """Compile the Bundle XAssets for the COD Tracker Database."""
 
         dbBundles: List[Dict[str, Any]] = []
-        bundles: List[Dict[str, Any]] = Utility.ReadFile(
+        bundles: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/bundles.json"
         )
-        dlc: List[Dict[str, Any]] = Utility.ReadFile(self, f"{self.eXAssets}/dlc.json")
+        dlc: List[Dict[str, Any]] = Utility.ImportXAsset(
+            self, f"{self.eXAssets}/dlc.json"
+        )
 
         for bundle in bundles:
             if bundle.get("id") is None:
@@ -105,9 +159,9 @@ class DBBundles:
             self.dbImages.append(b)
             self.dbImages.append(l)
 
-            if Utility.FileExists(self, f"{self.iImages}/{b}.png") is False:
+            if Utility.ImageExists(self, b) is False:
                 continue
-            elif Utility.FileExists(self, f"{self.iImages}/{l}.png") is False:
+            elif Utility.ImageExists(self, l) is False:
                 continue
 
             items: List[int] = []
@@ -115,6 +169,7 @@ class DBBundles:
             for item in bundle.get("items"):
                 items.append(item.get("id"))
 
+            bundle = dict(bundle)
             bundle["items"] = items
 
             bundle.pop("altId")
@@ -173,7 +228,7 @@ class DBBundles:
 
             self.dbImages.append(b)
 
-            if Utility.FileExists(self, f"{self.iImages}/{b}.png") is False:
+            if Utility.ImageExists(self, b) is False:
                 continue
 
             items: List[int] = []
@@ -190,6 +245,7 @@ class DBBundles:
 
                         break
 
+            entry = dict(entry)
             entry["items"] = items
 
             entry.pop("altId", None)
@@ -211,16 +267,10 @@ class DBBundles:
             dbBundles.append(entry)
             self.count += 1
 
-        Utility.WriteFile(
+        Utility.WriteDatabase(
             self,
             f"{self.eDatabase}/bundles.json",
             Utility.SortList(self, dbBundles, "name", key2="type"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_bundles.json",
-            Utility.SortList(self, dbBundles, "name", key2="type"),
         )
 
 
@@ -231,6 +281,8 @@ class DBLoot:
         """Compile the Loot XAssets for the COD Tracker Database."""
 
         dbLoot: List[Dict[str, Any]] = []
+        hashes: Set[str] = set()
+        duplicates: Dict[str, int] = {}
         loot: List[str] = [
             "accessories",
             "battlePassItems",
@@ -257,7 +309,7 @@ class DBLoot:
         ]
 
         for file in loot:
-            items: List[Dict[str, Any]] = Utility.ReadFile(
+            items: List[Dict[str, Any]] = Utility.ImportXAsset(
                 self, f"{self.eXAssets}/{file}.json"
             )
 
@@ -278,9 +330,11 @@ class DBLoot:
 
                 self.dbImages.append(i)
 
-                if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
+                if Utility.ImageExists(self, i) is False:
                     continue
 
+                item = dict(item)
+
                 item.pop("altId", None)
                 item.pop("altType", None)
                 item.pop("hidden", None)
@@ -335,13 +389,17 @@ class DBLoot:
 
                 item["slug"] = Utility.Sluggify(self, item.get("name"))
 
-                if item in dbLoot:
+                if (digest := Utility.HashContents(self, item)) in hashes:
+                    duplicates[file] = duplicates.get(file, 0) + 1
+
                     continue
 
+                hashes.add(digest)
+
                 dbLoot.append(item)
                 self.count += 1
 
-        weapons: List[Dict[str, Any]] = Utility.ReadFile(
+        weapons: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/weapons.json"
         )
 
@@ -358,9 +416,11 @@ class DBLoot:
 
                 self.dbImages.append(i)
 
-                if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
+                if Utility.ImageExists(self, i) is False:
                     continue
 
+                variant = dict(variant)
+
                 variant.pop("altId")
 
                 if variant.get("flavor") is None:
@@ -398,16 +458,13 @@ class DBLoot:
                 dbLoot.append(variant)
                 self.count += 1
 
-        Utility.WriteFile(
+        for file, count in duplicates.items():
+            log.info(f"Dropped {count:,} duplicate Loot items from {file}.json")
+
+        Utility.WriteDatabase(
             self,
             f"{self.eDatabase}/loot.json",
             Utility.SortList(self, dbLoot, "name", key2="rarity"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_loot.json",
-            Utility.SortList(self, dbLoot, "name", key2="rarity"),
         )
 
 
@@ -418,19 +475,31 @@ class DBOperators:
         """Compile the Operator XAssets for the COD Tracker Database."""
 
         dbOperators: List[Dict[str, Any]] = []
-        operators: List[Dict[str, Any]] = Utility.ReadFile(
+        operators: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/operators.json"
         )
-        skins: List[Dict[str, Any]] = Utility.ReadFile(
+        skins: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/operatorSkins.json"
         )
-        executions: List[Dict[str, Any]] = Utility.ReadFile(
+        executions: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/executions.json"
         )
-        quips: List[Dict[str, Any]] = Utility.ReadFile(
+        quips: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/operatorQuips.json"
         )
 
+        cosmeticImages: List[str] = []
+        skinGroups: Dict[int, List[Tuple[int, int]]] = DBOperators.Group(
+            self, skins, cosmeticImages
+        )
+        exGroups: Dict[int, List[Tuple[int, int]]] = DBOperators.Group(
+            self, executions, cosmeticImages
+        )
+        quipGroups: Dict[int, List[Tuple[int, int]]] = DBOperators.Group(
+            self, quips, cosmeticImages
+        )
+        grouped: bool = False
+
         for operator in operators:
             if operator.get("id") is None:
                 continue
@@ -443,87 +512,35 @@ class DBOperators:
 
             self.dbImages.append(i)
 
-            if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
+            if Utility.ImageExists(self, i) is False:
                 continue
 
-            operator["skins"] = []
-            operator["executions"] = []
-            operator["quips"] = []
-            operator["slug"] = Utility.Sluggify(self, operator.get("name"))
-
-            for skin in Utility.SortList(self, skins, "name", key2="rarity"):
-                if (skinId := skin.get("id")) is None:
-                    continue
-                elif skin.get("name") is None:
-                    continue
-                elif (i := skin.get("image")) is None:
-                    continue
-                elif (skinOpId := skin.get("operatorId")) is None:
-                    continue
+            # Cosmetic images are only listed once an Operator is compiled
+            if grouped is False:
+                self.dbImages.extend(cosmeticImages)
+                grouped = True
 
-                self.dbImages.append(i)
-
-                if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
-                    continue
-
-                if skinOpId == operator.get("id"):
-                    operator["skins"].append(skinId)
-                elif (skinOpId == 29999) and (
-                    operator.get("altId").startswith("t9") is False
-                ):
-                    operator["skins"].append(skinId)
-                elif (skinOpId == 29998) and (
-                    operator.get("altId").startswith("t9") is False
-                ):
-                    if operator.get("launchOperator") is True:
-                        operator["skins"].append(skinId)
-
-            for execution in Utility.SortList(self, executions, "name", key2="rarity"):
-                if (exId := execution.get("id")) is None:
-                    continue
-                elif execution.get("name") is None:
-                    continue
-                elif (i := execution.get("image")) is None:
-                    continue
-                elif (exOpId := execution.get("operatorId")) is None:
-                    continue
-
-                self.dbImages.append(i)
-
-                if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
-                    continue
-
-                if exOpId == operator.get("id"):
-                    operator["executions"].append(exId)
-                elif (exOpId == 29999) and (
-                    operator.get("altId").startswith("t9") is False
-                ):
-                    operator["executions"].append(exId)
-                elif exOpId == 29997:
-                    if operator.get("altId").startswith("t9") is True:
-                        operator["executions"].append(exId)
-
-            for quip in Utility.SortList(self, quips, "name", key2="rarity"):
-                if (quipId := quip.get("id")) is None:
-                    continue
-                elif quip.get("name") is None:
-                    continue
-                elif (i := quip.get("image")) is None:
-                    continue
-                elif (quipOpId := quip.get("operatorId")) is None:
-                    continue
+            t9: bool = operator.get("altId").startswith("t9")
+            skinIds: Set[int] = {operator.get("id")}
+            exIds: Set[int] = {operator.get("id")}
+            quipIds: Set[int] = {operator.get("id")}
 
-                self.dbImages.append(i)
+            # Universal (29999), launch (29998) and T9 exclusive (29997)
+            if t9 is False:
+                skinIds.add(29999)
+                exIds.add(29999)
+                quipIds.add(29999)
 
-                if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
-                    continue
+                if operator.get("launchOperator") is True:
+                    skinIds.add(29998)
+            else:
+                exIds.add(29997)
 
-                if quipOpId == operator.get("id"):
-                    operator["quips"].append(quipId)
-                elif (quipOpId == 29999) and (
-                    operator.get("altId").startswith("t9") is False
-                ):
-                    operator["quips"].append(quipId)
+            operator = dict(operator)
+            operator["skins"] = DBOperators.Assemble(self, skinGroups, skinIds)
+            operator["executions"] = DBOperators.Assemble(self, exGroups, exIds)
+            operator["quips"] = DBOperators.Assemble(self, quipGroups, quipIds)
+            operator["slug"] = Utility.Sluggify(self, operator.get("name"))
 
             operator.pop("altId")
             operator.pop("type")
@@ -559,18 +576,55 @@ class DBOperators:
             dbOperators.append(operator)
             self.count += 1
 
-        Utility.WriteFile(
+        Utility.WriteDatabase(
             self,
             f"{self.eDatabase}/operators.json",
             Utility.SortList(self, dbOperators, "name", key2="faction"),
-            compress=True,
         )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_operators.json",
-            Utility.SortList(self, dbOperators, "name", key2="faction"),
+
+    def Group(
+        self: Any, cosmetics: List[Dict[str, Any]], images: List[str]
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Group the provided Operator cosmetics by their Operator ID, each
+        ID paired with its position in the sorted cosmetics so that the
+        groups of an Operator can be merged in order.
+        """
+
+        groups: Dict[int, List[Tuple[int, int]]] = {}
+        sort: List[Dict[str, Any]] = Utility.SortList(
+            self, cosmetics, "name", key2="rarity"
         )
 
+        for position, cosmetic in enumerate(sort):
+            if (cosmeticId := cosmetic.get("id")) is None:
+                continue
+            elif cosmetic.get("name") is None:
+                continue
+            elif (i := cosmetic.get("image")) is None:
+                continue
+            elif (operatorId := cosmetic.get("operatorId")) is None:
+                continue
+
+            images.append(i)
+
+            if Utility.ImageExists(self, i) is False:
+                continue
+
+            groups.setdefault(operatorId, []).append((position, cosmeticId))
+
+        return groups
+
+    def Assemble(
+        self: Any, groups: Dict[int, List[Tuple[int, int]]], operatorIds: Set[int]
+    ) -> List[int]:
+        """
+        Return the IDs of the cosmetics grouped under the provided Operator
+        IDs in their sorted order.
+        """
+
+        return [c for _, c in merge(*[groups.get(i, []) for i in operatorIds])]
+
 
 class DBWeapons:
     """Weapon XAssets for the COD Tracker Database."""
@@ -579,7 +633,7 @@ class DBWeapons:
         """Compile the Weapon XAssets for the COD Tracker Database."""
 
         dbWeapons: List[Dict[str, Any]] = []
-        weapons: List[Dict[str, Any]] = Utility.ReadFile(
+        weapons: List[Dict[str, Any]] = Utility.ImportXAsset(
             self, f"{self.eXAssets}/weapons.json"
         )
 
@@ -611,6 +665,7 @@ class DBWeapons:
 
                 variants.append(variant.get("id"))
 
+            weapon = dict(weapon)
             weapon["variants"] = variants
 
             weapon.pop("maxAttachments")
@@ -641,14 +696,152 @@ class DBWeapons:
             dbWeapons.append(weapon)
             self.count += 1
 
-        Utility.WriteFile(
+        Utility.WriteDatabase(
             self,
             f"{self.eDatabase}/weapons.json",
             Utility.SortList(self, dbWeapons, "name", key2="altName"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_weapons.json",
-            Utility.SortList(self, dbWeapons, "name", key2="altName"),
         )
+
+
+class DBSQLite:
+    """SQLite export of the COD Tracker Database."""
+
+    # Normalized tables and their columns, in insertion order
+    tables: Dict[str, List[str]] = {
+        "loot": [
+            "id INTEGER",
+            "slug TEXT",
+            "name TEXT",
+            "type TEXT",
+            "rarity TEXT",
+            "season TEXT",
+            "image TEXT",
+            "animated INTEGER",
+            "data TEXT",
+        ],
+        "variants": ["id INTEGER", "weaponId INTEGER", "position INTEGER"],
+        "bundle_items": ["id INTEGER", "bundleId INTEGER", "position INTEGER"],
+        "operator_skins": ["id INTEGER", "operatorId INTEGER", "position INTEGER"],
+        "battle_pass_items": [
+            "id INTEGER",
+            "season INTEGER",
+            "battlePass TEXT",
+            "tier INTEGER",
+            "free INTEGER",
+            "codPoints INTEGER",
+        ],
+    }
+
+    # Indexed columns of each table
+    indexes: Dict[str, List[str]] = {
+        "loot": ["id", "slug", "type", "season", "rarity"],
+        "variants": ["id", "weaponId"],
+        "bundle_items": ["id", "bundleId"],
+        "operator_skins": ["id", "operatorId"],
+        "battle_pass_items": ["id", "season"],
+    }
+
+    def Compile(self: Any) -> None:
+        """
+        Compile the COD Tracker Database XAssets into a single SQLite file,
+        built alongside and then swapped into place.
+        """
+
+        path: str = f"{self.eDatabase}/database.sqlite"
+        temp: str = f"{path}.{os.getpid()}.tmp"
+
+        rows: Dict[str, List[Tuple[Any, ...]]] = {
+            "loot": DBSQLite.Loot(self),
+            "variants": DBSQLite.Members(self, "weapons", "variants"),
+            "bundle_items": DBSQLite.Members(self, "bundles", "items"),
+            "operator_skins": DBSQLite.Members(self, "operators", "skins"),
+            "battle_pass_items": DBSQLite.BattlePassItems(self),
+        }
+
+        Path(self.eDatabase).mkdir(parents=True, exist_ok=True)
+
+        try:
+            with closing(sqlite3.connect(temp)) as connection:
+                with connection:
+                    for table, columns in DBSQLite.tables.items():
+                        values: str = ", ".join("?" * len(columns))
+
+                        connection.execute(
+                            f"CREATE TABLE {table} ({', '.join(columns)})"
+                        )
+                        connection.executemany(
+                            f"INSERT INTO {table} VALUES ({values})", rows[table]
+                        )
+
+                        for column in DBSQLite.indexes[table]:
+                            connection.execute(
+                                f"CREATE INDEX {table}_{column} ON {table} ({column})"
+                            )
+
+            os.replace(temp, path)
+        except Exception as e:
+            log.error(f"Failed to write file {path}, {e}")
+
+            Path(temp).unlink(missing_ok=True)
+
+            return
+
+        log.info(f"Compiled {sum(len(r) for r in rows.values()):,} SQLite rows")
+
+    def Loot(self: Any) -> List[Tuple[Any, ...]]:
+        """Return the rows of the loot table."""
+
+        rows: List[Tuple[Any, ...]] = []
+
+        for item in Utility.ImportXAsset(self, f"{self.eDatabase}/loot.json"):
+            rows.append(
+                (
+                    item.get("id"),
+                    item.get("slug"),
+                    item.get("name"),
+                    item.get("type"),
+                    item.get("rarity"),
+                    item.get("season"),
+                    item.get("image"),
+                    item.get("animated", False),
+                    json.dumps(item, ensure_ascii=False),
+                )
+            )
+
+        return rows
+
+    def Members(self: Any, file: str, key: str) -> List[Tuple[Any, ...]]:
+        """
+        Return the rows relating each of the specified Database XAssets to
+        the IDs listed under the provided key, in their listed order.
+        """
+
+        rows: List[Tuple[Any, ...]] = []
+
+        for parent in Utility.ImportXAsset(self, f"{self.eDatabase}/{file}.json"):
+            for position, member in enumerate(parent.get(key, [])):
+                rows.append((member, parent.get("id"), position))
+
+        return rows
+
+    def BattlePassItems(self: Any) -> List[Tuple[Any, ...]]:
+        """Return the rows of the battle_pass_items table."""
+
+        rows: List[Tuple[Any, ...]] = []
+
+        for battlePass in Utility.ImportXAsset(
+            self, f"{self.eDatabase}/battlePasses.json"
+        ):
+            for item in battlePass.get("items"):
+                rows.append(
+                    (
+                        item.get("id"),
+                        battlePass.get("value"),
+                        battlePass.get("name"),
+                        item.get("tier"),
+                        item.get("free"),
+                        item.get("codPoints"),
+                    )
+                )
+
+        return rows
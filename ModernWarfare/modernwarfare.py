@@ -1,7 +1,9 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from bisect import bisect_right
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, TypedDict
 
-from utility import Utility
+from utility import FileWriter, KeyedTable, SpriteAnimator, TableRegistry, Utility
 
 from .database import Database
 from .XAssets import (
@@ -152,6 +154,28 @@ class CamoCategoryTable(TypedDict):
     name: str
 
 
+class TitleAvailability(dict):
+    """
+    Read-only title availability flags, shared between every item which
+    has the same availability.
+    """
+
+    def _ReadOnly(self: Any, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("TitleAvailability is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _ReadOnly
+    clear = pop = popitem = setdefault = update = _ReadOnly
+
+    def __copy__(self: Any) -> "TitleAvailability":
+        return self
+
+    def __deepcopy__(self: Any, memo: Dict[int, Any]) -> "TitleAvailability":
+        return self
+
+    def __reduce__(self: Any) -> Tuple[type, Tuple[Dict[str, bool]]]:
+        return (TitleAvailability, (dict(self),))
+
+
 class ModernWarfare:
     """Call of Duty: Modern Warfare (IW8)"""
 
@@ -165,6 +189,24 @@ class ModernWarfare:
         self.eImages: str = self.config["export"]["images"]
         self.eVideos: str = self.config["export"]["videos"]
         self.eDatabase: str = self.config["export"]["database"]
+        self.tables: TableRegistry = TableRegistry(self)
+        self.sprites: SpriteAnimator = SpriteAnimator(self)
+        self.writer: FileWriter = FileWriter(self)
+        self.assets: Dict[str, List[Any]] = {}
+
+        # Files that each global XAsset, shared between compilers, is read from
+        self.sharedInputs: Dict[str, List[str]] = {
+            "localize": [
+                f"{self.iXAssets}/localize.json",
+                "ModernWarfare/placeholders.json",
+            ],
+            "lootTypes": [f"{self.iXAssets}/loot/loot_master.csv"],
+            "itemSources": [f"{self.iXAssets}/mp/itemsourcetable.csv"],
+            "operatorIds": [f"{self.iXAssets}/loot/operator_ids.csv"],
+            "weaponClasses": [f"{self.iXAssets}/mp/weaponClassTable.csv"],
+            "attachCategories": [f"{self.iXAssets}/mp/attachmentcategorytable.csv"],
+            "camoCategories": [f"{self.iXAssets}/mp/camocategorytable.csv"],
+        }
 
     def Compile(self: Any) -> None:
         """Compile and export all supported XAsset types for Modern Warfare."""
@@ -173,221 +215,313 @@ class ModernWarfare:
 
         # Global and reused XAssets
         self.localize: Dict[str, Optional[str]] = ModernWarfare.LoadLocalize(self)
-        self.lootTypes: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/loot_master.csv", LootMaster, 1
-        )
-        self.itemSources: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/itemsourcetable.csv", ItemSourceTable
+        self.lootTypes: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/loot/loot_master.csv", LootMaster, 1
         )
-        self.operatorIds: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/loot/operator_ids.csv", OperatorIDs
+        ModernWarfare.LoadItemSources(self)
+        self.operatorIds: KeyedTable = KeyedTable(
+            self.tables.Read(f"{self.iXAssets}/loot/operator_ids.csv", OperatorIDs),
+            id="id",
         )
-        self.weaponClasses: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/weaponClassTable.csv", WeaponClassTable
+        self.weaponClasses: KeyedTable = KeyedTable(
+            self.tables.Read(
+                f"{self.iXAssets}/mp/weaponClassTable.csv", WeaponClassTable
+            ),
+            id="index",
+            localize=self.localize,
+            localized=["name"],
         )
-        self.attachCategories: List[Dict[str, Any]] = Utility.ReadCSV(
-            self,
-            f"{self.iXAssets}/mp/attachmentcategorytable.csv",
-            AttachmentCategoryTable,
+        self.attachCategories: KeyedTable = KeyedTable(
+            self.tables.Read(
+                f"{self.iXAssets}/mp/attachmentcategorytable.csv",
+                AttachmentCategoryTable,
+            ),
+            id="index",
+            localize=self.localize,
+            localized=["name"],
         )
-        self.camoCategories: List[Dict[str, Any]] = Utility.ReadCSV(
-            self, f"{self.iXAssets}/mp/camocategorytable.csv", CamoCategoryTable
+        self.camoCategories: KeyedTable = KeyedTable(
+            self.tables.Read(
+                f"{self.iXAssets}/mp/camocategorytable.csv", CamoCategoryTable
+            ),
+            id="index",
+            localize=self.localize,
+            localized=["name"],
         )
 
-        DLC.Compile(self)
-        Accessories.Compile(self)
-        BattlePasses.Compile(self)
-        BattlePassItems.Compile(self)
-        BRMissions.Compile(self)
-        Bundles.Compile(self)
-        CallingCards.Compile(self)
-        Camos.Compile(self)
-        Charms.Compile(self)
-        Consumables.Compile(self)
-        Emblems.Compile(self)
-        Equipment.Compile(self)
-        Executions.Compile(self)
-        Features.Compile(self)
-        GameTypes.Compile(self)
-        Gestures.Compile(self)
-        ItemSources.Compile(self)
-        Killstreaks.Compile(self)
-        KioskBR.Compile(self)
-        KioskBRTruck.Compile(self)
-        Maps.Compile(self)
-        MasteryChallenges.Compile(self)
-        MiscellaneousChallenges.Compile(self)
-        MissionItems.Compile(self)
-        Missions.Compile(self)
-        OfficerChallenges.Compile(self)
-        Operators.Compile(self)
-        PlaylistEvents.Compile(self)
-        ProgressionRewards.Compile(self)
-        Quips.Compile(self)
-        Reticles.Compile(self)
-        SeasonalChallenges.Compile(self)
-        SeasonalEvents.Compile(self)
-        Skins.Compile(self)
-        SpecialItems.Compile(self)
-        Splashes.Compile(self)
-        Sprays.Compile(self)
-        Stickers.Compile(self)
-        TurboChallenges.Compile(self)
-        UnlockItemsT9.Compile(self)
-        VehicleCamos.Compile(self)
-        VehicleHorns.Compile(self)
-        Vehicles.Compile(self)
-        VehicleTracks.Compile(self)
-        Weapons.Compile(self)
-        WeaponUnlockChallenges.Compile(self)
-        WeeklyChallengesBR.Compile(self)
-        WeeklyChallengesMP.Compile(self)
+        ModernWarfare.BuildLootTypes(self)
+
+        compilers: List[Any] = [
+            DLC,
+            Accessories,
+            BattlePasses,
+            BattlePassItems,
+            BRMissions,
+            Bundles,
+            CallingCards,
+            Camos,
+            Charms,
+            Consumables,
+            Emblems,
+            Equipment,
+            Executions,
+            Features,
+            GameTypes,
+            Gestures,
+            ItemSources,
+            Killstreaks,
+            KioskBR,
+            KioskBRTruck,
+            Maps,
+            MasteryChallenges,
+            MiscellaneousChallenges,
+            MissionItems,
+            Missions,
+            OfficerChallenges,
+            Operators,
+            PlaylistEvents,
+            ProgressionRewards,
+            Quips,
+            Reticles,
+            SeasonalChallenges,
+            SeasonalEvents,
+            Skins,
+            SpecialItems,
+            Splashes,
+            Sprays,
+            Stickers,
+            TurboChallenges,
+            UnlockItemsT9,
+            VehicleCamos,
+            VehicleHorns,
+            Vehicles,
+            VehicleTracks,
+            Weapons,
+            WeaponUnlockChallenges,
+            WeeklyChallengesBR,
+            WeeklyChallengesMP,
+        ]
 
         if self.config.get("compileDatabase") is True:
-            Database.Compile(self)
+            compilers.append(Database)
+
+        Utility.Schedule(self, compilers)
+
+        # Tables read by process pool workers are counted by those workers
+        log.info(
+            f"Parsed {self.tables.parses:,} CSV tables for {self.tables.reads:,} reads"
+        )
 
     def LoadLocalize(self: Any) -> Dict[str, Optional[str]]:
         """Load and filter the localized string entries for Modern Warfare."""
 
-        localize: Dict[str, Optional[str]] = Utility.ReadFile(
-            self, f"{self.iXAssets}/localize.json"
-        )
-        placeholders: dict = Utility.ReadFile(self, "ModernWarfare/placeholders.json")
+        sources: List[str] = self.sharedInputs["localize"]
+
+        # The filtering and stripping code also invalidates the snapshot
+        paths: List[str] = [*sources, *Utility.GetCodePaths(self)]
+
+        if (localize := Utility.ReadSnapshot(self, "localize", paths)) is not None:
+            return localize
+
+        localize: Dict[str, Optional[str]] = Utility.ReadFile(self, sources[0])
 
-        for key in localize:
-            value: Optional[str] = localize.get(key)
+        modifiers: Counter[str] = Counter()
 
+        ModernWarfare.LoadPlaceholders(self)
+
+        for key, value in localize.items():
             if value is None:
                 continue
+            elif ModernWarfare.IsPlaceholder(self, value.lower()) is True:
+                localize[key] = None
 
-            for placeholder in placeholders.get("whole"):
-                if value.lower() == placeholder.lower():
-                    localize[key] = None
+                continue
 
-                    break
+            localize[key] = Utility.StripCodes(self, value, modifiers)
 
-            for placeholder in placeholders.get("begins"):
-                if value.lower().startswith(placeholder.lower()) is True:
-                    localize[key] = None
+        if len(modifiers) > 0:
+            found: str = ", ".join(
+                f"^{modifier} ({count:,})"
+                for modifier, count in modifiers.most_common()
+            )
 
-                    break
+            log.warning(f"Potential color codes found: {found}")
 
-            for placeholder in placeholders.get("ends"):
-                if value.lower().endswith(placeholder.lower()) is True:
-                    localize[key] = None
+        Utility.WriteSnapshot(self, "localize", paths, localize)
 
-                    break
+        return localize
+
+    def LoadPlaceholders(self: Any) -> None:
+        """
+        Compile the placeholder localized strings for Modern Warfare into
+        lookup tables, grouping the prefixes and suffixes by length.
+        """
 
-            if (value := localize.get(key)) is not None:
-                value = Utility.StripColorCodes(self, value)
-                value = Utility.StripButtonCodes(self, value)
+        placeholders: dict = Utility.ReadFile(self, "ModernWarfare/placeholders.json")
 
-                localize[key] = value
+        self.placeholderWhole: Set[str] = {
+            placeholder.lower() for placeholder in placeholders.get("whole")
+        }
+        self.placeholderBegins: Dict[int, Set[str]] = {}
+        self.placeholderEnds: Dict[int, Set[str]] = {}
 
-        return localize
+        for placeholder in placeholders.get("begins"):
+            self.placeholderBegins.setdefault(len(placeholder), set()).add(
+                placeholder.lower()
+            )
+
+        for placeholder in placeholders.get("ends"):
+            self.placeholderEnds.setdefault(len(placeholder), set()).add(
+                placeholder.lower()
+            )
+
+    def IsPlaceholder(self: Any, value: str) -> bool:
+        """
+        Determine whether or not the provided lowercase localized string
+        is a placeholder.
+        """
+
+        if value in self.placeholderWhole:
+            return True
+
+        for length, prefixes in self.placeholderBegins.items():
+            if value[:length] in prefixes:
+                return True
+
+        for length, suffixes in self.placeholderEnds.items():
+            if value[len(value) - length :] in suffixes:
+                return True
+
+        return False
+
+    def LoadItemSources(self: Any) -> None:
+        """Load and index the item sources for Modern Warfare by marketPlaceID."""
+
+        self.itemSources: Tuple[Mapping[str, Any], ...] = self.tables.Read(
+            f"{self.iXAssets}/mp/itemsourcetable.csv", ItemSourceTable
+        )
+        self.itemSourceIds: Dict[int, List[Dict[str, Any]]] = {}
+        self.availabilities: Dict[Tuple[bool, ...], TitleAvailability] = {}
+
+        for source in self.itemSources:
+            self.itemSourceIds.setdefault(source.get("marketPlaceID"), []).append(
+                source
+            )
 
     def GetLootRarity(self: Any, value: int) -> Optional[str]:
         """Get the loot rarity for the provided value."""
 
         return self.localize.get(f"LOOT_MP/QUALITY_{value}")
 
+    def BuildLootTypes(self: Any) -> None:
+        """
+        Build the precomputed lookups used by GetLootType from the
+        loot/loot_master.csv and mp/itemsourcetable.csv XAssets.
+        """
+
+        # Partially defined in ui/utils/lootutils.lua
+        refTypes: Dict[str, Optional[str]] = {
+            "weapon": "LOOT_MP/ITEM_TYPE_WEAPON",
+            "operator": "LOOT_MP/OPERATOR",
+            "operator_skin": "LOOT_MP/OPERATOR_SKIN",
+            "executions": "LOOT_MP/OPERATOR_EXECUTION",
+            "equipment": "LOOT_MP/EQUIPMENT",
+            "accessory": "LOOT_MP/WATCH",
+            "playercards": "LOOT_MP/CALLING_CARD",
+            "weapon_charm": "LOOT_MP/CHARM",
+            "quip": "LOOT_MP/OPERATOR_QUIP",
+            "camo": "LOOT_MP/CAMO",
+            "emblems": "LOOT_MP/EMBLEM",
+            "attachment": "LOOT_MP/ATTACHMENT",
+            "sticker": "LOOT_MP/STICKER",
+            "xp_token": "LOOT_MP/CONSUMABLE",
+            "markeritem": "LOOT_MP/CONSUMABLE",
+            "reticle": "LOOT_MP/RETICLE",
+            "blueprint": "LOOT_MP/ITEM_TYPE_WEAPON",
+            "battlepass": "LOOT_MP/BATTLE_PASS",
+            "vehicle_track": "LOOT_MP/VEHICLE_TRACK",
+            "vehicle_horn": "LOOT_MP/VEHICLE_HORN",
+            "feature": "LOOT_MP/FEATURE",
+            "gestures": "LOOT_MP/GESTURES",
+            "mission": "LOOT_MP/MISSION",
+            "weapon_attachment": "LOOT_MP/ATTACHMENT",
+            "perk": "LOOT_MP/PERK",
+            "t9_equipment": "LOOT_MP/EQUIPMENT",
+            "killstreak": "LOOT_MP/STREAK",
+            "class": "LOOT_MP/FEATURE",
+            "zm_unlockable": "LOOT_MP/FEATURE",
+            "weapon_skill": "LOOT_MP/FEATURE",
+            "bonuscard": "LOOT_MP/FEATURE",
+            "vehicleskin": "LOOT_MP/VEHICLE_SKIN",
+            "bundle": "MENU/BUNDLE_TYPE_VARIETY",
+            "placeholder": None,
+            "arcadegame": "LOOT_MP/ARCADE_GAME",
+            "sprays": "LOOT_MP/SPRAYS",
+        }
+        refNames: Dict[str, Optional[str]] = {
+            refType: self.localize.get(key) for refType, key in refTypes.items()
+        }
+
+        # Ranges may overlap, in which case the first range in file order
+        # takes precedence. Split them into disjoint segments so that each
+        # ID resolves with a single bisect.
+        ranges: List[Dict[str, Any]] = [
+            loot
+            for loot in self.lootTypes
+            if (loot.get("rangeStart") is not None)
+            and (loot.get("rangeEnd") is not None)
+            and (loot.get("typeNameLoc") != "LOOT_MP/PLACEHOLDER")
+        ]
+        bounds: List[int] = sorted(
+            {loot.get("rangeStart") for loot in ranges}
+            | {loot.get("rangeEnd") + 1 for loot in ranges}
+        )
+
+        self.lootTypeStarts: List[int] = []
+        self.lootTypeRanges: List[Tuple[int, Optional[str]]] = []
+
+        for start, nextStart in zip(bounds, bounds[1:]):
+            for loot in ranges:
+                if (start < loot.get("rangeStart")) or (start > loot.get("rangeEnd")):
+                    continue
+
+                self.lootTypeStarts.append(start)
+                self.lootTypeRanges.append(
+                    (nextStart - 1, self.localize.get(loot.get("typeNameLoc")))
+                )
+
+                break
+
+        # A source with an unknown refType falls through to the next source
+        # sharing its marketPlaceID, so keep the unknown refTypes for logging.
+        self.lootSourceTypes: Dict[int, Optional[str]] = {}
+        self.lootSourceUnknowns: Dict[int, List[str]] = {}
+
+        for id, sources in self.itemSourceIds.items():
+            for source in sources:
+                if (refType := source.get("refType")) in refNames:
+                    self.lootSourceTypes[id] = refNames[refType]
+
+                    break
+
+                self.lootSourceUnknowns.setdefault(id, []).append(refType)
+
     def GetLootType(self: Any, id: int) -> Optional[str]:
         """Get the loot type for the provided ID."""
 
         if id is None:
             return
 
-        for loot in self.lootTypes:
-            start: int = loot.get("rangeStart")
-            end: int = loot.get("rangeEnd")
-
-            if (id >= start) and (id <= end):
-                typeNameLoc: Optional[str] = loot.get("typeNameLoc")
+        if (i := bisect_right(self.lootTypeStarts, id) - 1) >= 0:
+            end, typeName = self.lootTypeRanges[i]
 
-                if typeNameLoc == "LOOT_MP/PLACEHOLDER":
-                    continue
+            if id <= end:
+                return typeName
 
-                return self.localize.get(typeNameLoc)
+        for refType in self.lootSourceUnknowns.get(id, []):
+            log.warning(f"Unknown loot refType {refType} for ID {id}")
 
-        for source in self.itemSources:
-            if source.get("marketPlaceID") == id:
-                refType: Optional[str] = source.get("refType")
-
-                # Partially defined in ui/utils/lootutils.lua
-                if refType == "weapon":
-                    return self.localize.get("LOOT_MP/ITEM_TYPE_WEAPON")
-                elif refType == "operator":
-                    return self.localize.get("LOOT_MP/OPERATOR")
-                elif refType == "operator_skin":
-                    return self.localize.get("LOOT_MP/OPERATOR_SKIN")
-                elif refType == "executions":
-                    return self.localize.get("LOOT_MP/OPERATOR_EXECUTION")
-                elif refType == "equipment":
-                    return self.localize.get("LOOT_MP/EQUIPMENT")
-                elif refType == "accessory":
-                    return self.localize.get("LOOT_MP/WATCH")
-                elif refType == "playercards":
-                    return self.localize.get("LOOT_MP/CALLING_CARD")
-                elif refType == "weapon_charm":
-                    return self.localize.get("LOOT_MP/CHARM")
-                elif refType == "quip":
-                    return self.localize.get("LOOT_MP/OPERATOR_QUIP")
-                elif refType == "camo":
-                    return self.localize.get("LOOT_MP/CAMO")
-                elif refType == "emblems":
-                    return self.localize.get("LOOT_MP/EMBLEM")
-                elif refType == "attachment":
-                    return self.localize.get("LOOT_MP/ATTACHMENT")
-                elif refType == "sticker":
-                    return self.localize.get("LOOT_MP/STICKER")
-                elif refType == "xp_token":
-                    return self.localize.get("LOOT_MP/CONSUMABLE")
-                elif refType == "markeritem":
-                    return self.localize.get("LOOT_MP/CONSUMABLE")
-                elif refType == "reticle":
-                    return self.localize.get("LOOT_MP/RETICLE")
-                elif refType == "blueprint":
-                    return self.localize.get("LOOT_MP/ITEM_TYPE_WEAPON")
-                elif refType == "battlepass":
-                    return self.localize.get("LOOT_MP/BATTLE_PASS")
-                elif refType == "vehicle_track":
-                    return self.localize.get("LOOT_MP/VEHICLE_TRACK")
-                elif refType == "vehicle_horn":
-                    return self.localize.get("LOOT_MP/VEHICLE_HORN")
-                elif refType == "feature":
-                    return self.localize.get("LOOT_MP/FEATURE")
-                elif refType == "gestures":
-                    return self.localize.get("LOOT_MP/GESTURES")
-                elif refType == "mission":
-                    return self.localize.get("LOOT_MP/MISSION")
-                elif refType == "weapon_attachment":
-                    return self.localize.get("LOOT_MP/ATTACHMENT")
-                elif refType == "perk":
-                    return self.localize.get("LOOT_MP/PERK")
-                elif refType == "t9_equipment":
-                    return self.localize.get("LOOT_MP/EQUIPMENT")
-                elif refType == "killstreak":
-                    return self.localize.get("LOOT_MP/STREAK")
-                elif refType == "class":
-                    return self.localize.get("LOOT_MP/FEATURE")
-                elif refType == "zm_unlockable":
-                    return self.localize.get("LOOT_MP/FEATURE")
-                elif refType == "weapon_skill":
-                    return self.localize.get("LOOT_MP/FEATURE")
-                elif refType == "bonuscard":
-                    return self.localize.get("LOOT_MP/FEATURE")
-                elif refType == "vehicleskin":
-                    return self.localize.get("LOOT_MP/VEHICLE_SKIN")
-                elif refType == "bundle":
-                    return self.localize.get("MENU/BUNDLE_TYPE_VARIETY")
-                elif refType == "placeholder":
-                    return
-                elif refType == "arcadegame":
-                    return self.localize.get("LOOT_MP/ARCADE_GAME")
-                elif refType == "sprays":
-                    return self.localize.get("LOOT_MP/SPRAYS")
-                else:
-                    log.warning(f"Unknown loot refType {refType} for ID {id}")
+        return self.lootSourceTypes.get(id)
 
     def GetLootSeason(self: Any, license: int) -> Optional[str]:
         """Get the loot season for the provided value."""
@@ -425,30 +559,23 @@ class ModernWarfare:
             # for use with Black Ops Cold War Operators.
             return 29997
 
-        for operator in self.operatorIds:
-            if reference == operator.get("ref"):
-                return operator.get("id")
+        if (operator := self.operatorIds.byRef.get(reference)) is not None:
+            return operator.get("id")
 
     def GetWeaponClass(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified Weapon Class."""
 
-        for weaponClass in self.weaponClasses:
-            if reference == weaponClass.get("ref"):
-                return self.localize.get(weaponClass.get("name"))
+        return self.weaponClasses.GetLocalized(reference)
 
     def GetAttachmentCategory(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified attachment category."""
 
-        for category in self.attachCategories:
-            if category.get("ref") == reference:
-                return self.localize.get(category.get("name"))
+        return self.attachCategories.GetLocalized(reference)
 
     def GetCamoCategory(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified camo category."""
 
-        for category in self.camoCategories:
-            if category.get("ref") == reference:
-                return self.localize.get(category.get("name"))
+        return self.camoCategories.GetLocalized(reference)
 
     def GetAttribute(self: Any, reference: str) -> Optional[str]:
         """
@@ -584,18 +711,24 @@ class ModernWarfare:
     def GetTitleAvailability(self: Any, id: int) -> Dict[str, bool]:
         """Get the title availability for the specified item."""
 
-        for item in self.itemSources:
-            if id == item.get("marketPlaceID"):
-                return {
-                    "vanguard": bool(item.get("equippableS4")),
-                    "coldWar": bool(item.get("equippableT9")),
-                    "warzone": bool(item.get("equippableWZ")),
-                    "modernWarfare": bool(item.get("equippableIW8MP")),
-                }
-
-        return {
-            "vanguard": False,
-            "coldWar": False,
-            "warzone": True,
-            "modernWarfare": True,
-        }
+        if (sources := self.itemSourceIds.get(id)) is None:
+            flags: Tuple[bool, ...] = (False, False, True, True)
+        else:
+            flags: Tuple[bool, ...] = (
+                bool(sources[0].get("equippableS4")),
+                bool(sources[0].get("equippableT9")),
+                bool(sources[0].get("equippableWZ")),
+                bool(sources[0].get("equippableIW8MP")),
+            )
+
+        if (availability := self.availabilities.get(flags)) is None:
+            availability = TitleAvailability(
+                vanguard=flags[0],
+                coldWar=flags[1],
+                warzone=flags[2],
+                modernWarfare=flags[3],
+            )
+
+            self.availabilities[flags] = availability
+
+        return availability
@@ -1,5 +1,5 @@
 import logging
-from sys import exit
+from sys import argv, exit
 from typing import Any, Dict, Optional
 
 import coloredlogs
@@ -43,12 +43,25 @@ class Hyde:
             self.ModernWarfare.Compile()
 
     def LoadConfiguration(self: Any) -> Dict[str, Any]:
-        """Load the configurable values from config.json"""
+        """
+        Load the configurable values from config.json and the command-line
+        arguments.
+        """
 
         config: Optional[Dict[str, Any]] = Utility.ReadFile(self, "config.json")
 
-        if config is not None:
-            return dict(config)
+        if config is None:
+            return
+
+        config = dict(config)
+
+        # Recompile every XAsset, even those whose inputs are unchanged
+        if "--force" in argv:
+            for title in config.values():
+                if isinstance(title, dict):
+                    title["force"] = True
+
+        return config
 
 
 if __name__ == "__main__":
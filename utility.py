@@ -1,19 +1,89 @@
+import copyreg
 import csv
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import pickle
 import re
 import shutil
+import struct
 import subprocess
+import sys
+import threading
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
-from glob import glob
-from itertools import islice
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from PIL import Image
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Read-only table rows are sent to spawned workers as copies of their dicts.
+copyreg.pickle(MappingProxyType, lambda row: (TableRegistry.Row, (dict(row),)))
+
+# Digests of the files hashed this run, keyed by path, size and modification time.
+digests: Dict[Tuple[str, int, int], str] = {}
+
+# Row decoders generated by Utility.GetDecoder, keyed by TypedDict.
+decoders: Dict[Any, Callable[[List[str]], Dict[str, Any]]] = {}
+
+# Directory indexes built by Utility.GetDirectory, keyed by path.
+directories: Dict[str, "DirectoryIndex"] = {}
+
+# Image catalogs built by Utility.GetImages, keyed by path.
+catalogs: Dict[str, "ImageCatalog"] = {}
+
+# Title instance shared with the compilers run by Utility.Schedule workers.
+worker: Any = None
+
+# Increment whenever the structure of snapshots changes. Changes to the code
+# which processes them are detected from its source files.
+SNAPSHOT_VERSION: int = 1
+
+# Call of Duty color codes (^X) and button codes with their replacements.
+COLOR_CODES: str = "0123456789*+;./<>=?&()L'-:$,@BR"
+BUTTON_CODES: Dict[str, str] = {
+    "[{ONFOOT:+breath_sprint;+holdbreath}]": "button",
+    "[{ui_alt2}]": "button",
+    "[{+frag}]": "button",
+    "[{+activate}]": "button",
+    "[{BUTTON_SELECTCHOICE+gostand}]": "button",
+}
+COLOR_PATTERN: re.Pattern[str] = re.compile(f"\\^[{re.escape(COLOR_CODES)}]")
+BUTTON_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(re.escape(code) for code in BUTTON_CODES)
+)
+CODE_PATTERN: re.Pattern[str] = re.compile(
+    f"{COLOR_PATTERN.pattern}|{BUTTON_PATTERN.pattern}"
+)
+
 
 class Utility:
     """Utilitarian functions intended to reduce duplicate code."""
@@ -42,51 +112,603 @@ class Utility:
 
         entries: List[Dict[str, Any]] = []
         fields: Dict[str, Any] = types.__annotations__
+        schema: str = ",".join(f"{k}:{v.__name__}" for k, v in fields.items())
+        key: str = f"csv|{path}|{skip}|{types.__name__}|{schema}"
+
+        # Snapshots are invalidated by changes to the decoding code as well
+        paths: List[str] = [path, __file__]
+
+        if (snapshot := Utility.ReadSnapshot(self, key, paths)) is not None:
+            return snapshot
+
+        decode: Callable[[List[str]], Dict[str, Any]] = Utility.GetDecoder(self, types)
+        width: int = len(fields)
 
         try:
             with open(path, "r", encoding="utf-8") as file:
-                if skip > 0:
-                    file: List[str] = file.readlines()[skip:]
+                for _ in range(skip):
+                    file.readline()
+
+                for row in csv.reader(file):
+                    if (length := len(row)) < width:
+                        # Blank lines are ignored, missing values become None
+                        if length == 0:
+                            continue
+
+                        row += [""] * (width - length)
 
-                for row in csv.DictReader(file, fieldnames=list(fields)):
                     try:
-                        entries.append(
-                            {
-                                key: None
-                                if ((v := value) == "") or (v is None)
-                                else fields[key](value)
-                                for key, value in islice(
-                                    row.items(), 0, len(list(fields))
-                                )
-                            }
-                        )
+                        entries.append(decode(row))
                     except Exception:
                         continue
         except Exception as e:
             log.error(f"Failed to read file {path}, {e}")
 
+            return entries
+
+        Utility.WriteSnapshot(self, key, paths, entries)
+
         return entries
 
+    def GetDecoder(
+        self: Any, types: TypedDict
+    ) -> Callable[[List[str]], Dict[str, Any]]:
+        """
+        Return a function which transforms a csv row to a dictionary of the
+        desired value types, generating it once per TypedDict. Empty values
+        become None.
+        """
+
+        if (decoder := decoders.get(types)) is not None:
+            return decoder
+
+        coercers: Dict[str, Any] = {}
+        values: List[str] = []
+
+        for index, (name, kind) in enumerate(types.__annotations__.items()):
+            if kind is str:
+                value: str = f"row[{index}] or None"
+            else:
+                coercers[f"c{index}"] = kind
+                value: str = f"c{index}(v) if (v := row[{index}]) else None"
+
+            values.append(f"{name!r}: {value}")
+
+        exec(f"def decode(row):\n    return {{{', '.join(values)}}}", coercers)
+
+        decoders[types] = coercers["decode"]
+
+        return decoders[types]
+
+    def ReadSnapshot(self: Any, key: str, paths: List[str]) -> Optional[Any]:
+        """
+        Return the parsed value cached for the specified key, provided that
+        none of the files it was parsed from have changed since.
+        """
+
+        if (directory := self.config.get("cache")) is None:
+            return
+
+        try:
+            with open(Utility.GetSnapshotPath(self, directory, key), "rb") as file:
+                header: Dict[str, Any] = pickle.load(file)
+
+                if header.get("version") != SNAPSHOT_VERSION:
+                    return
+                elif (header.get("key") != key) or (header.get("paths") != paths):
+                    return
+
+                for path, (size, mtime, digest) in zip(paths, header.get("inputs")):
+                    stat: os.stat_result = os.stat(path)
+
+                    if (stat.st_size == size) and (stat.st_mtime_ns == mtime):
+                        continue
+                    elif stat.st_size != size:
+                        return
+                    elif Utility.HashFile(self, path) != digest:
+                        return
+
+                return pickle.load(file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log.warning(f"Failed to read snapshot for {key}, {e}")
+
+    def WriteSnapshot(self: Any, key: str, paths: List[str], contents: Any) -> None:
+        """
+        Cache the parsed value for the specified key alongside the size,
+        modification time and content hash of the files it was parsed from.
+        """
+
+        if (directory := self.config.get("cache")) is None:
+            return
+
+        try:
+            inputs: List[Tuple[int, int, str]] = []
+
+            for path in paths:
+                stat: os.stat_result = os.stat(path)
+
+                inputs.append(
+                    (stat.st_size, stat.st_mtime_ns, Utility.HashFile(self, path))
+                )
+
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+            snapshot: str = Utility.GetSnapshotPath(self, directory, key)
+            temp: str = f"{snapshot}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+            with open(temp, "wb") as file:
+                pickle.dump(
+                    {
+                        "version": SNAPSHOT_VERSION,
+                        "key": key,
+                        "paths": paths,
+                        "inputs": inputs,
+                    },
+                    file,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+                pickle.dump(contents, file, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp, snapshot)
+        except Exception as e:
+            log.warning(f"Failed to write snapshot for {key}, {e}")
+
+    def GetSnapshotPath(self: Any, directory: str, key: str) -> str:
+        """Return the path of the snapshot file for the specified key."""
+
+        return f"{directory}/{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pickle"
+
+    def HashFile(self: Any, path: str) -> str:
+        """Return the hexadecimal BLAKE2 digest of the specified file."""
+
+        stat: os.stat_result = os.stat(path)
+        key: Tuple[str, int, int] = (path, stat.st_size, stat.st_mtime_ns)
+
+        if (known := digests.get(key)) is not None:
+            return known
+
+        digest: hashlib.blake2b = hashlib.blake2b()
+
+        with open(path, "rb") as file:
+            while chunk := file.read(1048576):
+                digest.update(chunk)
+
+        digests[key] = digest.hexdigest()
+
+        return digests[key]
+
+    def HashContents(self: Any, contents: Any) -> str:
+        """
+        Return the hexadecimal BLAKE2 digest of the provided JSON-serializable
+        contents, independent of the order of their keys.
+        """
+
+        canonical: str = json.dumps(
+            contents, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def JoinTable(
+        self: Any,
+        items: Iterable[Dict[str, Any]],
+        itemKey: Union[str, Callable[[Dict[str, Any]], Any]],
+        table: Iterable[Dict[str, Any]],
+        tableKey: Union[str, Callable[[Dict[str, Any]], Any]],
+        **kwargs,
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Yield each item alongside its matching table entry, indexing the
+        table by the specified key once rather than scanning it per item.
+        Keys may be a column name or a function of the row.
+
+        When multiple entries match an item, the last entry is yielded
+        unless first is set. If many is set, every matching entry is
+        yielded in table order.
+        """
+
+        if isinstance(itemKey, str):
+            itemKey: Callable[[Dict[str, Any]], Any] = lambda k, c=itemKey: k.get(c)
+        if isinstance(tableKey, str):
+            tableKey: Callable[[Dict[str, Any]], Any] = lambda k, c=tableKey: k.get(c)
+
+        index: Dict[Any, List[Dict[str, Any]]] = {}
+
+        for entry in table:
+            index.setdefault(tableKey(entry), []).append(entry)
+
+        for item in items:
+            if (entries := index.get(itemKey(item))) is None:
+                continue
+
+            if kwargs.get("many") is True:
+                for entry in entries:
+                    yield item, entry
+            elif kwargs.get("first") is True:
+                yield item, entries[0]
+            else:
+                yield item, entries[-1]
+
+    def Schedule(self: Any, tasks: List[Any]) -> None:
+        """
+        Run the Compile function of each provided task once every task
+        producing one of its declared inputs has finished, running tasks
+        which do not depend upon one another concurrently.
+
+        The worker count and pool type ("process" or "thread") are read
+        from the workers and pool configuration values. A single worker
+        runs the tasks serially in the order provided.
+        """
+
+        workers: int = self.config.get("workers", 1)
+        producers: Dict[str, Any] = {}
+
+        for task in tasks:
+            for output in task.outputs:
+                producers[output] = task
+
+        depends: Dict[Any, Set[Any]] = {}
+
+        for task in tasks:
+            depends[task] = {producers[i] for i in task.inputs if i in producers}
+            depends[task].discard(task)
+
+        pending: List[Any] = list(tasks)
+        done: Set[Any] = set()
+        compiled: List[Any] = []
+
+        if workers <= 1:
+            while len(pending) > 0:
+                for task in pending:
+                    if depends[task] <= done:
+                        break
+                else:
+                    raise ValueError(
+                        f"Circular dependency between {Utility.GetNames(self, pending)}"
+                    )
+
+                pending.remove(task)
+
+                if Utility.IsCompiled(self, task) is False:
+                    task.Compile(self)
+                    compiled.append(task)
+
+                done.add(task)
+        else:
+            Utility.RunConcurrently(self, workers, pending, depends, done, compiled)
+
+        # Manifests are only recorded once every output has been written
+        written, unchanged = self.writer.Wait()
+
+        log.info(f"Wrote {written:,} files, {unchanged:,} were unchanged")
+
+        for task in compiled:
+            Utility.WriteManifest(self, task)
+
+    def RunConcurrently(
+        self: Any,
+        workers: int,
+        pending: List[Any],
+        depends: Dict[Any, Set[Any]],
+        done: Set[Any],
+        compiled: List[Any],
+    ) -> None:
+        """
+        Run the pending tasks on a pool of the specified number of workers,
+        recording each task which was compiled.
+        """
+
+        running: Dict[Future, Any] = {}
+
+        with Utility.GetExecutor(self, workers) as executor:
+            while (len(pending) > 0) or (len(running) > 0):
+                progressed: bool = False
+
+                for task in [t for t in pending if depends[t] <= done]:
+                    pending.remove(task)
+
+                    if Utility.IsCompiled(self, task) is True:
+                        done.add(task)
+                        progressed = True
+                    elif len(depends[task]) > 0:
+                        # Tasks which consume the outputs of other tasks run in
+                        # the main process, where their published XAssets are.
+                        task.Compile(self)
+                        compiled.append(task)
+                        done.add(task)
+                        progressed = True
+                    else:
+                        running[executor.submit(Utility.RunWorker, task)] = task
+
+                if progressed is True:
+                    continue
+                elif len(running) == 0:
+                    raise ValueError(
+                        f"Circular dependency between {Utility.GetNames(self, pending)}"
+                    )
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    task = running.pop(future)
+
+                    # Surface exceptions raised by the task
+                    assets, counts = future.result()
+
+                    self.assets.update(assets)
+                    self.writer.Tally(*counts)
+
+                    compiled.append(task)
+                    done.add(task)
+
+    def IsCompiled(self: Any, task: Any) -> bool:
+        """
+        Return a boolean value indicating whether or not the outputs of the
+        provided task are up to date with its inputs, shared XAssets and
+        code, as recorded by its manifest.
+        """
+
+        if self.config.get("force") is True:
+            return False
+        elif getattr(task, "incremental", True) is False:
+            return False
+
+        outputs: Optional[List[str]] = Utility.ReadSnapshot(
+            self,
+            Utility.GetManifestKey(self, task),
+            Utility.GetManifestPaths(self, task),
+        )
+
+        if outputs is None:
+            return False
+
+        # Outputs recorded for another export directory are not up to date
+        if outputs != [output.format_map(vars(self)) for output in task.outputs]:
+            return False
+
+        for path in outputs:
+            if Utility.FileExists(self, path) is False:
+                return False
+
+        log.info(f"Skipped {task.__name__}, inputs unchanged")
+
+        return True
+
+    def WriteManifest(self: Any, task: Any) -> None:
+        """Record the inputs that the provided task was compiled from."""
+
+        if getattr(task, "incremental", True) is False:
+            return
+
+        paths: List[str] = Utility.GetManifestPaths(self, task)
+
+        # Tasks with missing inputs are compiled again on every run
+        for path in paths:
+            if Utility.FileExists(self, path) is False:
+                return
+
+        Utility.WriteSnapshot(
+            self,
+            Utility.GetManifestKey(self, task),
+            paths,
+            [output.format_map(vars(self)) for output in task.outputs],
+        )
+
+    def GetManifestKey(self: Any, task: Any) -> str:
+        """Return the snapshot key of the manifest for the provided task."""
+
+        return f"manifest|{task.__module__}.{task.__name__}"
+
+    def GetManifestPaths(self: Any, task: Any) -> List[str]:
+        """
+        Return the files that the provided task is compiled from, including
+        the source files of the global XAssets it reads and the code which
+        compiles it.
+        """
+
+        paths: List[str] = []
+
+        for input in task.inputs:
+            if "*" in (path := input.format_map(vars(self))):
+                directory, pattern = path.rsplit("/", 1)
+
+                paths.extend(Utility.GetDirectory(self, directory).Glob(pattern))
+            else:
+                paths.append(path)
+
+        for name in task.shared:
+            paths.extend(self.sharedInputs[name])
+
+        paths.extend(Utility.GetCodePaths(self, task.__module__))
+
+        return list(dict.fromkeys(paths))
+
+    def GetCodePaths(self: Any, *modules: str) -> List[str]:
+        """
+        Return the source files of the provided modules, the title and this
+        utility module, whose changes invalidate what was compiled by them.
+        """
+
+        paths: List[str] = []
+
+        for module in [*modules, type(self).__module__, __name__]:
+            paths.append(sys.modules[module].__file__)
+
+        return paths
+
+    def GetNames(self: Any, tasks: List[Any]) -> str:
+        """Return a comma-separated list of the names of the provided tasks."""
+
+        return ", ".join(task.__name__ for task in tasks)
+
+    def GetExecutor(self: Any, workers: int) -> Executor:
+        """
+        Return a pool of the configured type whose workers share the
+        provided title instance.
+        """
+
+        if self.config.get("pool", "process") == "process":
+            # Forked workers inherit the title and its global XAssets, while
+            # spawned workers (such as on Windows) receive a pickled copy once
+            # rather than per task.
+            if "fork" in multiprocessing.get_all_start_methods():
+                context: Any = multiprocessing.get_context("fork")
+            else:
+                context: Any = multiprocessing.get_context("spawn")
+
+            return ProcessPoolExecutor(
+                workers,
+                mp_context=context,
+                initializer=Utility.InitializeWorker,
+                initargs=(self,),
+            )
+
+        return ThreadPoolExecutor(
+            workers, initializer=Utility.InitializeWorker, initargs=(self,)
+        )
+
+    def InitializeWorker(title: Any) -> None:
+        """Store the title instance for the tasks run by this worker."""
+
+        global worker
+
+        worker = title
+
+    def RunWorker(task: Any) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        """
+        Compile the provided task using the title instance of this worker,
+        returning the XAssets that it published and, for forked workers,
+        the number of files it wrote and left unchanged.
+        """
+
+        task.Compile(worker)
+
+        counts: Tuple[int, int] = (0, 0)
+
+        # Writes queued by a forked worker must finish before it returns
+        if multiprocessing.parent_process() is not None:
+            counts = worker.writer.Wait()
+
+        paths: List[str] = [output.format_map(vars(worker)) for output in task.outputs]
+
+        return (
+            {path: worker.assets[path] for path in paths if path in worker.assets},
+            counts,
+        )
+
     def WriteFile(
         self: Any, path: str, contents: Union[str, dict, list], **kwargs
     ) -> None:
-        """Write the contents of the specified file."""
+        """
+        Write the contents of the specified file, in the background when the
+        title has a FileWriter. The contents must not be modified afterwards.
+        """
 
-        if Path(dirPath := (path.rsplit("/", 1)[0])).exists() is False:
-            Path(dirPath).mkdir(parents=True, exist_ok=True)
+        compress: bool = kwargs.get("compress") is True
+
+        if (writer := getattr(self, "writer", None)) is not None:
+            writer.Submit(path, contents, compress)
+
+            return
 
         try:
-            with open(path, "w+", encoding="utf-8") as file:
-                if path.rsplit(".")[1] == "json":
-                    if kwargs.get("compress") is True:
-                        file.write(json.dumps(contents, ensure_ascii=False))
-                    else:
-                        file.write(json.dumps(contents, indent=4, ensure_ascii=False))
-                else:
-                    file.write(contents)
+            Utility.ReplaceFile(
+                self, path, Utility.EncodeFile(self, path, contents, compress)
+            )
         except Exception as e:
             log.error(f"Failed to write file {path}, {e}")
 
+    def EncodeFile(
+        self: Any, path: str, contents: Union[str, dict, list], compress: bool
+    ) -> str:
+        """Encode the contents of the specified file for writing."""
+
+        if path.rsplit(".")[1] == "json":
+            if compress is True:
+                return json.dumps(contents, ensure_ascii=False)
+
+            return json.dumps(contents, indent=4, ensure_ascii=False)
+
+        return contents
+
+    def ReplaceFile(self: Any, path: str, data: str) -> bool:
+        """
+        Write the provided data to a temporary file and move it into place,
+        so that the specified file is never left partially written. Return
+        False, leaving the file untouched, if its contents are identical.
+        """
+
+        encoded: bytes = data.replace("\n", os.linesep).encode("utf-8")
+
+        try:
+            if os.stat(path).st_size == len(encoded):
+                digest: str = hashlib.blake2b(encoded).hexdigest()
+
+                if Utility.HashFile(self, path) == digest:
+                    return False
+        except FileNotFoundError:
+            pass
+
+        if Path(dirPath := (path.rsplit("/", 1)[0])).exists() is False:
+            Path(dirPath).mkdir(parents=True, exist_ok=True)
+
+        temp: str = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            with open(temp, "wb") as file:
+                file.write(encoded)
+
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+
+            raise
+
+        return True
+
+    def WriteDatabase(self: Any, path: str, contents: List[Any]) -> None:
+        """
+        Write the sorted Database XAsset compressed to the specified file and
+        publish it in memory for the SQLite export. The indented copy,
+        prefixed with an underscore, is only written when the debug
+        configuration value is set.
+        """
+
+        self.assets[path] = contents
+
+        Utility.WriteFile(self, path, contents, compress=True)
+
+        if self.config.get("debug") is True:
+            directory, filename = path.rsplit("/", 1)
+
+            Utility.WriteFile(self, f"{directory}/_{filename}", contents)
+
+    def ExportXAsset(self: Any, path: str, contents: List[Any]) -> None:
+        """
+        Write the compiled XAsset to the specified file and publish it in
+        memory for the later stages of the same run.
+        """
+
+        self.assets[path] = contents
+
+        Utility.WriteFile(self, path, contents)
+
+    def ImportXAsset(self: Any, path: str) -> Optional[List[Any]]:
+        """
+        Return the XAsset published for the specified file during this run,
+        otherwise read it from disk.
+
+        Published XAssets are shared rather than copied, so consumers must
+        copy any entry they modify.
+        """
+
+        if (contents := self.assets.get(path)) is not None:
+            return contents
+
+        return Utility.ReadFile(self, path)
+
     def FileExists(self: Any, path: str) -> bool:
         """
         Return a boolean value indicating whether or not the specified
@@ -99,38 +721,48 @@ class Utility:
         return False
 
     def GetMatchingFiles(
-        self: Any,
-        path: str,
-        fileType: str,
-        start: Optional[str],
-        end: Optional[str],
-        recursive: bool = False,
+        self: Any, path: str, fileType: str, start: Optional[str], end: Optional[str]
     ) -> List[str]:
         """
         Return a list of paths to the files in the specified directory
         which match the desired filetype and filename scheme.
         """
 
-        files: List[str] = []
+        return Utility.GetDirectory(self, path).Match(start, end, fileType)
+
+    def GetDirectory(self: Any, path: str) -> "DirectoryIndex":
+        """
+        Return the index of the specified directory, scanning it only on
+        the first request.
+        """
+
+        path = path.replace("\\", "/").rstrip("/")
 
-        for file in glob(f"{path}*.{fileType}", recursive=recursive):
-            filename: str = file.rsplit("\\")[1].split(".")[0]
+        if (index := directories.get(path)) is None:
+            index = directories[path] = DirectoryIndex(path)
 
-            if (start is not None) and (end is None):
-                if filename.startswith(start) is False:
-                    continue
-            elif (start is None) and (end is not None):
-                if filename.endswith(end) is False:
-                    continue
-            elif (start is not None) and (end is not None):
-                if (filename.startswith(start) is False) or (
-                    filename.endswith(end) is False
-                ):
-                    continue
+        return index
+
+    def GetImages(self: Any) -> "ImageCatalog":
+        """
+        Return the catalog of the images directory, scanning it only on
+        the first request.
+        """
+
+        path: str = self.iImages.replace("\\", "/").rstrip("/")
+
+        if (catalog := catalogs.get(path)) is None:
+            catalog = catalogs[path] = ImageCatalog(path, self.config.get("cache"))
+
+        return catalog
 
-            files.append(file)
+    def ImageExists(self: Any, image: str) -> bool:
+        """
+        Return a boolean value indicating whether or not the specified
+        image exists in the images directory.
+        """
 
-        return files
+        return Utility.GetImages(self).Exists(image)
 
     def GetCSVArray(
         self: Any, array: str, type: Any, delimiter: str = "|"
@@ -186,72 +818,57 @@ class Utility:
     def StripColorCodes(self: Any, input: str, quiet: bool = False) -> str:
         """Remove all Call of Duty color codes from the provided string."""
 
-        colors: List[str] = [
-            "0",
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "*",
-            "+",
-            ";",
-            ".",
-            "/",
-            "<",
-            ">",
-            "=",
-            "?",
-            "&",
-            "(",
-            ")",
-            "L",
-            "'",
-            "-",
-            ":",
-            "$",
-            ",",
-            "@",
-            "B",
-            "R",
-        ]
-        output: str = input
-
-        for i in colors:
-            output = output.replace(f"^{i}", "")
-
-        if "^" in output:
-            try:
-                modifier: str = output.split("^")[1][0]
+        output: str = COLOR_PATTERN.sub("", input)
 
-                if quiet is False:
-                    log.warning(f"Potential color code found: ^{modifier}")
-            except Exception:
-                pass
+        if quiet is False:
+            Utility.CountModifiers(self, output)
 
         return output
 
     def StripButtonCodes(self: Any, input: str) -> str:
         """Replace all Call of Duty button codes from the provided string."""
 
-        buttons: List[Dict[str, str]] = [
-            {"code": "[{ONFOOT:+breath_sprint;+holdbreath}]", "literal": "button"},
-            {"code": "[{ui_alt2}]", "literal": "button"},
-            {"code": "[{+frag}]", "literal": "button"},
-            {"code": "[{+activate}]", "literal": "button"},
-            {"code": "[{BUTTON_SELECTCHOICE+gostand}]", "literal": "button"},
-        ]
-        output: str = input
+        return BUTTON_PATTERN.sub(lambda m: BUTTON_CODES[m.group(0)], input)
 
-        for button in buttons:
-            output = output.replace(button.get("code"), button.get("literal"))
+    def StripCodes(
+        self: Any, input: str, modifiers: Optional[Counter[str]] = None
+    ) -> str:
+        """
+        Remove all Call of Duty color codes and replace all button codes
+        from the provided string in a single pass. Potential color codes
+        which remain are tallied in modifiers when provided, rather than
+        logged individually.
+        """
+
+        if ("^" not in input) and ("[{" not in input):
+            return input
+
+        output: str = CODE_PATTERN.sub(
+            lambda m: BUTTON_CODES.get(m.group(0), ""), input
+        )
+
+        Utility.CountModifiers(self, output, modifiers)
 
         return output
 
+    def CountModifiers(
+        self: Any, input: str, modifiers: Optional[Counter[str]] = None
+    ) -> None:
+        """
+        Tally the potential color code found in the provided string, or log
+        it when no tally is provided.
+        """
+
+        if "^" not in input:
+            return
+        elif (modifier := input.split("^")[1][:1]) == "":
+            return
+
+        if modifiers is not None:
+            modifiers[modifier] += 1
+        else:
+            log.warning(f"Potential color code found: ^{modifier}")
+
     def Sluggify(self: Any, input: str) -> str:
         """Transform the provided string into a URL-friendly slug."""
 
@@ -268,31 +885,495 @@ class Utility:
     def AnimateSprite(
         self: Any, filename: str, dimensions: List[Tuple[int, int]]
     ) -> bool:
-        """Animate the provided Spritesheet into a WEBM video."""
+        """
+        Animate the provided Spritesheet into a WEBM video. The animation is
+        queued on the title's SpriteAnimator, which must be waited upon.
+        """
 
-        with Image.open(f"{self.iImages}/{filename}.png") as file:
-            width, height = file.size
+        # Only Spritesheets are decoded, by the SpriteAnimator
+        if (size := Utility.GetImages(self).Dimensions(filename)) is None:
+            with Image.open(f"{self.iImages}/{filename}.png") as file:
+                size = file.size
 
-            for dimension in dimensions:
-                frameWidth: int = dimension[0]
-                frameHeight: int = dimension[1]
+        width, height = size
 
-                if (width == frameWidth) and (height == frameHeight):
-                    return False
+        for dimension in dimensions:
+            frameWidth: int = dimension[0]
+            frameHeight: int = dimension[1]
 
-                if (width % dimension[0] != 0) or (height % frameHeight != 0):
-                    continue
+            if (width == frameWidth) and (height == frameHeight):
+                return False
+
+            if (width % dimension[0] != 0) or (height % frameHeight != 0):
+                continue
+
+            if self.config.get("animateImages") is True:
+                Path(f"{self.eImages}").mkdir(parents=True, exist_ok=True)
+                Path(f"{self.eVideos}").mkdir(parents=True, exist_ok=True)
+
+                self.sprites.Submit(filename, frameWidth, frameHeight)
+
+            return True
+
+
+class KeyedTable:
+    """
+    Comma separated values (csv) table indexed by its reference and ID
+    columns for constant time lookups. The first row for each key wins.
+    """
+
+    def __init__(
+        self: Any,
+        rows: List[Dict[str, Any]],
+        ref: str = "ref",
+        id: Optional[str] = None,
+        localize: Optional[Dict[str, Optional[str]]] = None,
+        localized: Iterable[str] = (),
+    ) -> None:
+        self.rows: List[Dict[str, Any]] = rows
+        self.byRef: Dict[Any, Dict[str, Any]] = {}
+        self.byId: Dict[Any, Dict[str, Any]] = {}
+        self.localized: Dict[str, Dict[Any, Optional[str]]] = {
+            column: {} for column in localized
+        }
+
+        for row in rows:
+            if (key := row.get(ref)) not in self.byRef:
+                self.byRef[key] = row
+
+                for column, values in self.localized.items():
+                    values[key] = localize.get(row.get(column))
+
+            if id is not None:
+                self.byId.setdefault(row.get(id), row)
+
+    def GetLocalized(self: Any, ref: Any, column: str = "name") -> Optional[str]:
+        """Get the localized value of the specified column by reference."""
+
+        return self.localized[column].get(ref)
+
+
+class TableRegistry:
+    """
+    Comma separated values (csv) tables read during a single compile,
+    memoized by path and schema so that each file is parsed once however
+    many XAssets read it. Tables are shared, so rows are read-only views.
+    """
+
+    def __init__(self: Any, title: Any) -> None:
+        self.title: Any = title
+        self.tables: Dict[Tuple[Any, ...], Tuple[Mapping[str, Any], ...]] = {}
+        self.locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.parses: int = 0
+        self.reads: int = 0
+
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        return {"title": self.title, "tables": self.tables}
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        self.title = state["title"]
+        self.tables = state["tables"]
+        self.locks = {}
+        self.lock = threading.Lock()
+        self.parses = 0
+        self.reads = 0
+
+    def Row(row: Dict[str, Any]) -> Mapping[str, Any]:
+        """Return a read-only view of the provided table row."""
+
+        return MappingProxyType(row)
+
+    def Read(
+        self: Any, path: str, types: TypedDict, skip: int = 0
+    ) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Return the specified csv file transformed to the desired value
+        types, parsing it only on the first request.
+        """
+
+        key: Tuple[Any, ...] = (path, skip, tuple(types.__annotations__.items()))
+
+        with self.lock:
+            self.reads += 1
+
+            if (table := self.tables.get(key)) is not None:
+                return table
+
+            lock: threading.Lock = self.locks.setdefault(key, threading.Lock())
+
+        # Parse outside of the registry lock so that other tables are not
+        # blocked, while concurrent requests for this table wait for it.
+        with lock:
+            if (table := self.tables.get(key)) is not None:
+                return table
+
+            table = tuple(
+                TableRegistry.Row(row)
+                for row in Utility.ReadCSV(self.title, path, types, skip)
+            )
+
+            with self.lock:
+                self.tables[key] = table
+                self.parses += 1
+
+            log.debug(f"Parsed {path} as {types.__name__} ({len(table):,} rows)")
+
+        return table
+
+
+class DirectoryIndex:
+    """
+    Files of a single directory, scanned once and sorted by filename so
+    that prefix, suffix and glob queries bisect to their matches rather
+    than testing every file.
+    """
+
+    def __init__(self: Any, path: str) -> None:
+        self.path: str = path
+        self.names: List[str] = []
+        self.stems: Dict[str, List[Tuple[str, str]]] = {}
+        self.suffixes: Dict[str, List[Tuple[str, str]]] = {}
+
+        try:
+            with os.scandir(path) as entries:
+                self.names = sorted(e.name for e in entries if e.is_file())
+        except FileNotFoundError:
+            pass
+
+        # Filenames are split into the stem before the first period and the
+        # file type after the last, then grouped by file type.
+        for name in self.names:
+            if "." not in name:
+                continue
+
+            fileType: str = name.rsplit(".", 1)[1]
+            stem: str = name.split(".")[0]
+
+            self.stems.setdefault(fileType, []).append((stem, name))
+            self.suffixes.setdefault(fileType, []).append((stem[::-1], name))
+
+        for keys in [*self.stems.values(), *self.suffixes.values()]:
+            keys.sort()
+
+    def Prefix(self: Any, prefix: str, fileType: str) -> List[str]:
+        """
+        Return the sorted names of the files of the desired filetype whose
+        stem begins with prefix.
+        """
+
+        return DirectoryIndex.Range(self, self.stems.get(fileType, []), prefix)
+
+    def Suffix(self: Any, suffix: str, fileType: str) -> List[str]:
+        """
+        Return the sorted names of the files of the desired filetype whose
+        stem ends with suffix.
+        """
+
+        suffixes: List[Tuple[str, str]] = self.suffixes.get(fileType, [])
+
+        return sorted(DirectoryIndex.Range(self, suffixes, suffix[::-1]))
+
+    def Range(self: Any, keys: List[Tuple[str, str]], prefix: str) -> List[str]:
+        """Return the names of the sorted keys which begin with prefix."""
+
+        names: List[str] = []
+
+        for i in range(bisect_left(keys, (prefix,)), len(keys)):
+            if (key := keys[i])[0].startswith(prefix) is False:
+                break
+
+            names.append(key[1])
+
+        return names
+
+    def Match(
+        self: Any, start: Optional[str], end: Optional[str], fileType: str
+    ) -> List[str]:
+        """
+        Return the paths to the files of the desired filetype whose stem
+        begins with start and ends with end, either of which may be None.
+        """
+
+        if start is not None:
+            names: List[str] = self.Prefix(start, fileType)
+
+            if end is not None:
+                names = [n for n in names if n.split(".")[0].endswith(end)]
+        elif end is not None:
+            names: List[str] = self.Suffix(end, fileType)
+        else:
+            names: List[str] = [name for _, name in self.stems.get(fileType, [])]
+
+        return [f"{self.path}/{name}" for name in names]
+
+    def Glob(self: Any, pattern: str) -> List[str]:
+        """
+        Return the paths to the files whose name matches the provided glob
+        pattern, bisecting to the literal prefix before its first wildcard.
+        """
+
+        prefix: str = pattern
+
+        for wildcard in "*?[":
+            prefix = prefix.split(wildcard, 1)[0]
+
+        paths: List[str] = []
+
+        for i in range(bisect_left(self.names, prefix), len(self.names)):
+            if (name := self.names[i]).startswith(prefix) is False:
+                break
+            elif fnmatchcase(name, pattern) is True:
+                paths.append(f"{self.path}/{name}")
+
+        return paths
+
+
+class ImageCatalog:
+    """
+    Portable Network Graphics (png) files of the images directory,
+    scanned once and keyed by their basename along with their size and
+    modification time. The dimensions of each image are read from its
+    header on request and, when a cache directory is configured, kept
+    until the image is modified.
+    """
+
+    # Increment whenever the structure of the persisted headers changes.
+    version: int = 1
+
+    def __init__(self: Any, path: str, cache: Optional[str] = None) -> None:
+        self.path: str = path
+        self.cache: Optional[str] = cache
+        self.images: Dict[str, Tuple[int, int]] = {}
+        self.misses: Dict[str, bool] = {}
+        self.headers: Optional[
+            Dict[str, Tuple[Tuple[int, int], Tuple[int, int]]]
+        ] = None
+        self.modified: bool = False
+
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".png") is False:
+                        continue
+                    elif entry.is_file() is False:
+                        continue
+
+                    stat: os.stat_result = entry.stat()
+
+                    self.images[entry.name[:-4]] = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            log.warning(f"Failed to catalog images, {path} does not exist")
+
+        log.debug(f"Cataloged {len(self.images):,} images in {path}")
+
+    def Exists(self: Any, image: str) -> bool:
+        """
+        Return a boolean value indicating whether or not the specified
+        image exists, checking the filesystem for images missing from the
+        catalog as names may be case-insensitive, such as on NTFS.
+        """
+
+        if image in self.images:
+            return True
+        elif (exists := self.misses.get(image)) is None:
+            exists = self.misses[image] = Path(f"{self.path}/{image}.png").is_file()
+
+        return exists
+
+    def Stat(self: Any, image: str) -> Optional[Tuple[int, int]]:
+        """Return the size and modification time of the specified image."""
+
+        return self.images.get(image)
+
+    def Dimensions(self: Any, image: str) -> Optional[Tuple[int, int]]:
+        """
+        Return the width and height of the specified image, read from the
+        IHDR chunk of its header rather than decoding it. Return None if
+        the file is not a valid png.
+        """
+
+        if self.headers is None:
+            ImageCatalog.Load(self)
+
+        stat: Optional[Tuple[int, int]] = self.images.get(image)
 
-                columns: int = width // frameWidth
-                rows: int = height // frameHeight
+        if (known := self.headers.get(image)) is not None:
+            if (stat is not None) and (known[0] == stat):
+                return known[1]
 
-                if self.config.get("animateImages") is True:
-                    Path(f"{self.eImages}/temp/").mkdir(parents=True, exist_ok=True)
-                    Path(f"{self.eImages}").mkdir(parents=True, exist_ok=True)
-                    Path(f"{self.eVideos}").mkdir(parents=True, exist_ok=True)
+        try:
+            with open(f"{self.path}/{image}.png", "rb") as file:
+                header: bytes = file.read(24)
+        except FileNotFoundError:
+            return
+
+        if header[:8] != b"\x89PNG\r\n\x1a\n":
+            return
+        elif header[12:16] != b"IHDR":
+            return
+
+        dimensions: Tuple[int, int] = struct.unpack(">II", header[16:24])
+
+        if stat is not None:
+            self.headers[image] = (stat, dimensions)
+            self.modified = True
+
+        return dimensions
+
+    def Load(self: Any) -> None:
+        """Read the image headers persisted in the cache directory."""
+
+        self.headers = {}
+
+        if self.cache is None:
+            return
+
+        try:
+            with open(f"{self.cache}/images.pickle", "rb") as file:
+                persisted: Dict[str, Any] = pickle.load(file)
+
+            if persisted.get("version") != ImageCatalog.version:
+                return
+            elif persisted.get("path") != self.path:
+                return
+
+            self.headers = persisted.get("headers")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log.warning(f"Failed to read image headers for {self.path}, {e}")
+
+    def Save(self: Any) -> None:
+        """Persist the image headers read this run to the cache directory."""
+
+        if (self.cache is None) or (self.modified is False):
+            return
+
+        try:
+            Path(self.cache).mkdir(parents=True, exist_ok=True)
+
+            persisted: str = f"{self.cache}/images.pickle"
+            temp: str = f"{persisted}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+            with open(temp, "wb") as file:
+                pickle.dump(
+                    {
+                        "version": ImageCatalog.version,
+                        "path": self.path,
+                        "headers": self.headers,
+                    },
+                    file,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+
+            os.replace(temp, persisted)
+
+            self.modified = False
+        except Exception as e:
+            log.warning(f"Failed to write image headers for {self.path}, {e}")
+
+
+class SpriteAnimator:
+    """
+    Spritesheets animated in the background by a bounded pool of threads,
+    each streaming its frames to ffmpeg as raw video rather than writing
+    them to temporary files. When a cache directory is configured, the
+    animations are stored by the content of their Spritesheet and reused.
+    """
+
+    # Options which ffmpeg reads the streamed frames with, changes to which
+    # invalidate the cached animations.
+    settings: List[str] = ["-f", "rawvideo", "-pix_fmt", "rgba", "-framerate", "10"]
+
+    def __init__(self: Any, title: Any) -> None:
+        self.title: Any = title
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.jobs: Dict[str, Future] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.cache: Optional[str] = None
+        self.hits: int = 0
+        self.misses: int = 0
+
+        if (directory := title.config.get("cache")) is not None:
+            self.cache = f"{directory}/sprites"
+
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        return {"title": self.title, "cache": self.cache}
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        self.title = state["title"]
+        self.executor = None
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.cache = state["cache"]
+        self.hits = 0
+        self.misses = 0
+
+    def Submit(self: Any, filename: str, frameWidth: int, frameHeight: int) -> None:
+        """Queue the provided Spritesheet to be animated, once per run."""
+
+        with self.lock:
+            if filename in self.jobs:
+                return
+
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max(1, self.title.config.get("workers", 1)),
+                    thread_name_prefix="SpriteAnimator",
+                )
+
+            self.jobs[filename] = self.executor.submit(
+                SpriteAnimator.Animate, self, filename, frameWidth, frameHeight
+            )
+
+    def Animate(self: Any, filename: str, frameWidth: int, frameHeight: int) -> None:
+        """
+        Crop the frames of the provided Spritesheet, saving the first as an
+        image, and encode them into a WEBM video.
+        """
+
+        title: Any = self.title
+        source: str = f"{title.iImages}/{filename}.png"
+        outputs: List[str] = [
+            f"{title.eVideos}/{filename}.webm",
+            f"{title.eImages}/{filename}.png",
+        ]
+
+        if self.cache is not None:
+            key: str = SpriteAnimator.GetKey(self, source, frameWidth, frameHeight)
 
-                    i: int = 1
+            if SpriteAnimator.Restore(self, key, outputs) is True:
+                with self.lock:
+                    self.hits += 1
 
+                return
+
+        # Outputs are moved into place once complete, never left partial
+        temps: List[str] = [SpriteAnimator.GetTempPath(self, o) for o in outputs]
+
+        try:
+            with Image.open(source) as file:
+                columns: int = file.width // frameWidth
+                rows: int = file.height // frameHeight
+
+                process: subprocess.Popen = subprocess.Popen(
+                    [
+                        "ffmpeg",
+                        *SpriteAnimator.settings,
+                        "-s",
+                        f"{frameWidth}x{frameHeight}",
+                        "-i",
+                        "-",
+                        "-y",
+                        temps[0],
+                    ],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+
+                try:
                     for row in range(0, rows):
                         for column in range(0, columns):
                             frame = file.crop(
@@ -304,30 +1385,292 @@ class Utility:
                                 )
                             )
 
-                            frame.save(f"{self.eImages}/temp/{filename}_{i:03}.png")
+                            if (row == 0) and (column == 0):
+                                frame.save(temps[1])
+
+                            process.stdin.write(frame.convert("RGBA").tobytes())
+                except BrokenPipeError:
+                    pass
+                finally:
+                    process.stdin.close()
+
+            if (code := process.wait()) != 0:
+                log.warning(f"Failed to animate {filename}, ffmpeg exited with {code}")
+
+                return
+
+            for temp, output in zip(temps, outputs):
+                os.replace(temp, output)
+        finally:
+            for temp in temps:
+                Path(temp).unlink(missing_ok=True)
+
+        log.info(f"Animated {filename} ({columns}x{rows})")
+
+        with self.lock:
+            self.misses += 1
+
+        if self.cache is not None:
+            SpriteAnimator.Store(self, key, outputs)
+
+    def GetKey(self: Any, source: str, frameWidth: int, frameHeight: int) -> str:
+        """
+        Return the cache key of the animation of the provided Spritesheet,
+        derived from its content, frame dimensions and encoder settings.
+        """
+
+        key: str = "|".join(
+            [
+                Utility.HashFile(self.title, source),
+                f"{frameWidth}x{frameHeight}",
+                *SpriteAnimator.settings,
+            ]
+        )
+
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def GetTempPath(self: Any, path: str) -> str:
+        """
+        Return a temporary path alongside the specified file, which keeps
+        its suffix so that ffmpeg and Pillow detect the file format.
+        """
+
+        stem, suffix = path.rsplit(".", 1)
+
+        return f"{stem}.{os.getpid()}.{threading.get_ident()}.tmp.{suffix}"
+
+    def Restore(self: Any, key: str, outputs: List[str]) -> bool:
+        """
+        Copy the cached animation for the specified key to the provided
+        output paths, returning False if it is not cached.
+        """
+
+        for output in outputs:
+            cached: str = f"{self.cache}/{key}{Path(output).suffix}"
+            temp: str = SpriteAnimator.GetTempPath(self, output)
+
+            try:
+                shutil.copyfile(cached, temp)
+                os.replace(temp, output)
+            except FileNotFoundError:
+                Path(temp).unlink(missing_ok=True)
+
+                return False
+
+            # Refresh the modification time, which orders eviction
+            os.utime(cached)
 
-                            if i == 1:
-                                frame.save(f"{self.eImages}/{filename}.png")
+        return True
 
-                            i += 1
+    def Store(self: Any, key: str, outputs: List[str]) -> None:
+        """Cache the animation at the provided output paths for the specified key."""
 
-                    subprocess.call(
-                        [
-                            "ffmpeg",
-                            "-framerate",
-                            "10",
-                            "-i",
-                            f"{self.eImages}/temp/{filename}_%03d.png",
-                            "-y",
-                            f"{self.eVideos}/{filename}.webm",
-                        ],
-                        stderr=subprocess.DEVNULL,
+        try:
+            Path(self.cache).mkdir(parents=True, exist_ok=True)
+
+            for output in outputs:
+                cached: str = f"{self.cache}/{key}{Path(output).suffix}"
+                temp: str = SpriteAnimator.GetTempPath(self, cached)
+
+                shutil.copyfile(output, temp)
+                os.replace(temp, cached)
+        except Exception as e:
+            log.warning(f"Failed to cache animation {key}, {e}")
+
+    def Evict(self: Any) -> int:
+        """
+        Remove the least recently used animations from the cache until it
+        fits within the spriteCacheSize configuration value, in megabytes.
+        Return the number of animations removed.
+        """
+
+        limit: int = self.title.config.get("spriteCacheSize", 1024) * 1048576
+        entries: Dict[str, List[Tuple[int, int, str]]] = {}
+
+        try:
+            with os.scandir(self.cache) as files:
+                for file in files:
+                    if file.is_file() is False:
+                        continue
+
+                    stat: os.stat_result = file.stat()
+
+                    entries.setdefault(file.name.split(".")[0], []).append(
+                        (stat.st_mtime_ns, stat.st_size, file.path)
                     )
+        except FileNotFoundError:
+            return 0
 
-                    shutil.rmtree(f"{self.eImages}/temp/", ignore_errors=True)
+        total: int = sum(size for e in entries.values() for _, size, _ in e)
+        evicted: int = 0
 
-                    log.info(f"Animated {filename} ({columns}x{rows})")
+        for files in sorted(entries.values(), key=lambda e: max(e)[0]):
+            if total <= limit:
+                break
 
-                    return True
-                else:
-                    return True
+            for _, size, path in files:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+                total -= size
+
+            evicted += 1
+
+        return evicted
+
+    def Wait(self: Any) -> None:
+        """
+        Block until every queued Spritesheet has been animated, raising the
+        first error encountered, then report on and trim the cache.
+        """
+
+        with self.lock:
+            executor: Optional[ThreadPoolExecutor] = self.executor
+            jobs: List[Future] = list(self.jobs.values())
+
+            self.executor = None
+            self.jobs = {}
+
+        if executor is None:
+            return
+
+        executor.shutdown(wait=True)
+
+        for job in jobs:
+            job.result()
+
+        if self.cache is None:
+            return
+
+        evicted: int = SpriteAnimator.Evict(self)
+
+        log.info(
+            f"Reused {self.hits:,} cached animations and encoded {self.misses:,}, "
+            f"evicted {evicted:,} from the cache"
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+
+class FileWriter:
+    """
+    Files encoded and written in the background by a bounded pool of
+    threads, each written to a temporary file and moved into place unless
+    its contents are unchanged. Errors are raised once every queued file
+    has been written, by Wait.
+    """
+
+    def __init__(self: Any, title: Any) -> None:
+        self.title: Any = title
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.jobs: List[Tuple[str, Future]] = []
+        self.latest: Dict[str, Future] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.pid: int = os.getpid()
+        self.written: int = 0
+        self.unchanged: int = 0
+
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        return {"title": self.title}
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        self.title = state["title"]
+        self.executor = None
+        self.jobs = []
+        self.latest = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.written = 0
+        self.unchanged = 0
+
+    def Submit(
+        self: Any, path: str, contents: Union[str, dict, list], compress: bool
+    ) -> None:
+        """Queue the provided contents to be written to the specified file."""
+
+        with self.lock:
+            # Forked workers inherit the writer, but not its threads
+            if self.pid != os.getpid():
+                self.executor = None
+                self.jobs = []
+                self.latest = {}
+                self.pid = os.getpid()
+                self.written = 0
+                self.unchanged = 0
+
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max(1, self.title.config.get("workers", 1)),
+                    thread_name_prefix="FileWriter",
+                )
+
+            # Writes to the same file are applied in the order queued
+            if (previous := self.latest.get(path)) is not None:
+                wait([previous])
+
+            job: Future = self.executor.submit(
+                FileWriter.Write, self, path, contents, compress
+            )
+
+            self.jobs.append((path, job))
+            self.latest[path] = job
+
+    def Write(
+        self: Any, path: str, contents: Union[str, dict, list], compress: bool
+    ) -> bool:
+        """
+        Encode and write the contents of the specified file, returning False
+        if the file was unchanged.
+        """
+
+        data: str = Utility.EncodeFile(self.title, path, contents, compress)
+
+        return Utility.ReplaceFile(self.title, path, data)
+
+    def Tally(self: Any, written: int, unchanged: int) -> None:
+        """Count the files written and left unchanged by another process."""
+
+        with self.lock:
+            self.written += written
+            self.unchanged += unchanged
+
+    def Wait(self: Any) -> Tuple[int, int]:
+        """
+        Block until every queued file has been written, logging each file
+        which failed and raising an error if any did. Return the number of
+        files written and left unchanged since the previous wait.
+        """
+
+        with self.lock:
+            executor: Optional[ThreadPoolExecutor] = self.executor
+            jobs: List[Tuple[str, Future]] = self.jobs
+            counts: List[int] = [self.written, self.unchanged]
+
+            self.executor = None
+            self.jobs = []
+            self.latest = {}
+            self.written = 0
+            self.unchanged = 0
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        failures: int = 0
+
+        for path, job in jobs:
+            if (e := job.exception()) is not None:
+                log.error(f"Failed to write file {path}, {e}")
+
+                failures += 1
+            elif job.result() is True:
+                counts[0] += 1
+            else:
+                counts[1] += 1
+
+        if failures > 0:
+            raise OSError(f"Failed to write {failures:,} files")
+
+        return (counts[0], counts[1])